@@ -153,8 +153,6 @@ async def create_task(request: TaskCreateRequest) -> TaskResponse:
         source=source,
         due_date=request.due_date,
         tags=request.tags,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
     )
 
     created = await service.create_task(task, personal=request.personal)
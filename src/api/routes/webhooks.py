@@ -1,8 +1,14 @@
 """Webhook routes for Slack and Discord."""
 
+import json
 from typing import Any
 from fastapi import APIRouter, Request, Response, HTTPException
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is an optional speedup
+    _json_loads = json.loads
+
 from ...services.mention_service import MentionService
 from ...container import get_container
 
@@ -15,6 +21,11 @@ def get_mention_service() -> MentionService:
     return container.mention_service
 
 
+async def read_payload(request: Request) -> Any:
+    """Decode the JSON request body (uses orjson when installed)."""
+    return _json_loads(await request.body())
+
+
 @router.post("/slack")
 async def slack_webhook(request: Request) -> dict[str, Any]:
     """Handle Slack webhook events.
@@ -23,7 +34,7 @@ async def slack_webhook(request: Request) -> dict[str, Any]:
     - URL verification challenge
     - Event callbacks (app_mention, message)
     """
-    payload = await request.json()
+    payload = await read_payload(request)
 
     # Handle URL verification
     if payload.get("type") == "url_verification":
@@ -52,7 +63,7 @@ async def discord_webhook(request: Request) -> dict[str, Any]:
     - Ping (type 1)
     - Message events
     """
-    payload = await request.json()
+    payload = await read_payload(request)
 
     # Handle Discord ping (verification)
     if payload.get("type") == 1:
@@ -332,6 +332,7 @@ def serve(host: str, port: int, reload: bool):
 @cli.command("summary")
 def summary():
     """Show task summary."""
+    from datetime import datetime
     from ..domain.models import TaskStatus, TaskPriority
 
     container = get_container()
@@ -346,20 +347,21 @@ def summary():
     # Count by status
     status_counts = {}
     for status in TaskStatus:
-        count = sum(1 for t in tasks if t.status == status)
+        count = sum(1 for t in tasks if t.status is status)
         if count > 0:
             status_counts[status.value] = count
 
     # Count by priority
     priority_counts = {}
     for priority in TaskPriority:
-        count = sum(1 for t in tasks if t.priority == priority)
+        count = sum(1 for t in tasks if t.priority is priority)
         if count > 0:
             priority_counts[priority.value] = count
 
     # Due today and overdue
-    due_today = sum(1 for t in tasks if t.is_due_today() and t.status != TaskStatus.DONE)
-    overdue_count = sum(1 for t in tasks if t.is_overdue())
+    now = datetime.now()
+    due_today = sum(1 for t in tasks if t.is_due_today(now) and t.status is not TaskStatus.DONE)
+    overdue_count = sum(1 for t in tasks if t.is_overdue(now))
 
     click.echo("📊 Task Summary\n")
     click.echo(f"Total tasks: {len(tasks)}\n")
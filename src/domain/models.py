@@ -3,9 +3,12 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Callable, NamedTuple, Optional
 import uuid
 
+# Placeholder for an omitted Task.updated_at; replaced by created_at on init
+_UNSET_TIMESTAMP = datetime.min
+
 
 class TaskStatus(Enum):
     """Task status values."""
@@ -35,7 +38,7 @@ class TaskSource(Enum):
     MANUAL = "manual"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskId:
     """Value object for task identification."""
 
@@ -55,7 +58,7 @@ class TaskId:
         return self.value
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Core task entity."""
 
@@ -63,8 +66,8 @@ class Task:
     title: str
     status: TaskStatus
     source: TaskSource
-    created_at: datetime
-    updated_at: datetime
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = _UNSET_TIMESTAMP  # Defaults to created_at
     description: Optional[str] = None
     priority: TaskPriority = TaskPriority.MEDIUM
     due_date: Optional[datetime] = None
@@ -73,25 +76,40 @@ class Task:
     external_id: Optional[str] = None  # Notion page ID, etc.
     metadata: dict = field(default_factory=dict)
 
-    def is_due_today(self) -> bool:
-        """Check if task is due today."""
+    def __post_init__(self) -> None:
+        if self.updated_at is _UNSET_TIMESTAMP:
+            self.updated_at = self.created_at
+
+    def is_due_today(self, now: Optional[datetime] = None) -> bool:
+        """Check if task is due today.
+
+        Args:
+            now: Reference time, so callers checking many tasks can share one
+        """
         if not self.due_date:
             return False
-        today = datetime.now().date()
+        today = (now or datetime.now()).date()
         return self.due_date.date() == today
 
-    def is_overdue(self) -> bool:
-        """Check if task is overdue."""
+    def is_overdue(self, now: Optional[datetime] = None) -> bool:
+        """Check if task is overdue.
+
+        Args:
+            now: Reference time, so callers checking many tasks can share one
+        """
         if not self.due_date:
             return False
-        if self.status == TaskStatus.DONE:
+        if self.status is TaskStatus.DONE:
             return False
-        return self.due_date < datetime.now()
+        return self.due_date < (now or datetime.now())
+
 
+class Mention(NamedTuple):
+    """Represents a parsed mention from Slack/Discord.
 
-@dataclass(frozen=True)
-class Mention:
-    """Represents a parsed mention from Slack/Discord."""
+    A NamedTuple rather than a dataclass: one is built per incoming webhook
+    and tuple construction is much cheaper than a frozen dataclass __init__.
+    """
 
     source_platform: str  # "slack" or "discord"
     channel_id: str
@@ -102,10 +120,10 @@ class Mention:
     timestamp: datetime
     message_url: str = ""
     thread_context: Optional[str] = None
-    raw_payload: dict = field(default_factory=dict)
+    raw_payload: Optional[dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Notification:
     """Notification to be sent."""
 
@@ -120,7 +138,7 @@ class Notification:
     scheduled_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskFilter:
     """Filter criteria for task queries."""
 
@@ -133,3 +151,38 @@ class TaskFilter:
     tags: Optional[list[str]] = None
     limit: int = 100
     offset: int = 0
+
+    def to_predicate(self) -> Callable[[Task], bool]:
+        """Build a predicate that applies only the criteria that are set.
+
+        Pagination (limit/offset) is left to the caller.
+        """
+        checks: list[Callable[[Task], bool]] = []
+
+        if self.status:
+            statuses = frozenset(self.status)
+            checks.append(lambda t: t.status in statuses)
+        if self.priority:
+            priorities = frozenset(self.priority)
+            checks.append(lambda t: t.priority in priorities)
+        if self.source:
+            sources = frozenset(self.source)
+            checks.append(lambda t: t.source in sources)
+        if self.assignee:
+            assignee = self.assignee
+            checks.append(lambda t: t.assignee == assignee)
+        if self.due_before:
+            due_before = self.due_before
+            checks.append(lambda t: t.due_date is not None and t.due_date < due_before)
+        if self.due_after:
+            due_after = self.due_after
+            checks.append(lambda t: t.due_date is not None and t.due_date > due_after)
+        if self.tags:
+            tags = frozenset(self.tags)
+            checks.append(lambda t: not tags.isdisjoint(t.tags))
+
+        if not checks:
+            return lambda t: True
+        if len(checks) == 1:
+            return checks[0]
+        return lambda t: all(check(t) for check in checks)
@@ -21,6 +21,10 @@ class TaskRepository(Protocol):
         """Create a new task, return the created task."""
         ...
 
+    async def create_many(self, tasks: Sequence[Task]) -> list[Task]:
+        """Create several tasks, return the created tasks in order."""
+        ...
+
     async def update(self, task: Task) -> Task:
         """Update an existing task, return the updated task."""
         ...
@@ -46,6 +50,10 @@ class CacheRepository(Protocol):
         """Get all cached tasks."""
         ...
 
+    async def size(self) -> int:
+        """Count cached tasks."""
+        ...
+
     async def set(
         self, key: str, task: Task, ttl_seconds: Optional[int] = None
     ) -> None:
@@ -153,8 +153,6 @@ class MCPTools:
             source=source,
             due_date=parsed_due_date,
             tags=tags or [],
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
         )
 
         created = await self.task_service.create_task(task, personal=personal)
@@ -269,18 +267,19 @@ class MCPTools:
         # Count by status
         status_counts = {}
         for status in TaskStatus:
-            count = sum(1 for t in tasks if t.status == status)
+            count = sum(1 for t in tasks if t.status is status)
             status_counts[status.value] = count
 
         # Count by priority
         priority_counts = {}
         for priority in TaskPriority:
-            count = sum(1 for t in tasks if t.priority == priority)
+            count = sum(1 for t in tasks if t.priority is priority)
             priority_counts[priority.value] = count
 
         # Due today and overdue
-        due_today = sum(1 for t in tasks if t.is_due_today() and t.status != TaskStatus.DONE)
-        overdue = sum(1 for t in tasks if t.is_overdue())
+        now = datetime.now()
+        due_today = sum(1 for t in tasks if t.is_due_today(now) and t.status is not TaskStatus.DONE)
+        overdue = sum(1 for t in tasks if t.is_overdue(now))
 
         return {
             "total_tasks": len(tasks),
@@ -1,10 +1,30 @@
 """Discord webhook parser."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 
 from src.domain.models import Mention
 
 
+def _parse_timestamp(value: str) -> datetime:
+    """Parse a Discord ISO-8601 timestamp.
+
+    The common ``YYYY-MM-DDTHH:MM:SSZ`` shape is read from fixed offsets;
+    anything else (fractional seconds, explicit offsets) goes through
+    ``datetime.fromisoformat``.
+    """
+    if len(value) == 20 and value[10] == "T" and value[19] == "Z":
+        return datetime(
+            int(value[0:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+            int(value[17:19]),
+            tzinfo=timezone.utc,
+        )
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
 class DiscordWebhookParser:
     """Parse Discord webhook payloads."""
 
@@ -30,9 +50,7 @@ class DiscordWebhookParser:
         if timestamp_str:
             try:
                 # Discord uses ISO format with Z suffix
-                timestamp = datetime.fromisoformat(
-                    timestamp_str.replace("Z", "+00:00")
-                )
+                timestamp = _parse_timestamp(timestamp_str)
             except (ValueError, TypeError):
                 timestamp = datetime.now()
         else:
@@ -27,7 +27,9 @@ class SlackWebhookParser:
         # Extract timestamp
         ts = event.get("ts", "0")
         try:
-            timestamp = datetime.fromtimestamp(float(ts))
+            # Slack ts is "<seconds>.<micros>"; skip float() for whole seconds
+            seconds = float(ts) if "." in ts else int(ts)
+            timestamp = datetime.fromtimestamp(seconds)
         except (ValueError, TypeError):
             timestamp = datetime.now()
 
@@ -17,26 +17,11 @@ class InMemoryTaskRepository:
 
     async def list_tasks(self, filter: Optional[TaskFilter] = None) -> Sequence[Task]:
         """List tasks matching filter criteria."""
-        tasks = list(self._tasks.values())
-
         if filter is None:
-            return tasks
-
-        # Apply filters
-        if filter.status:
-            tasks = [t for t in tasks if t.status in filter.status]
-        if filter.priority:
-            tasks = [t for t in tasks if t.priority in filter.priority]
-        if filter.source:
-            tasks = [t for t in tasks if t.source in filter.source]
-        if filter.assignee:
-            tasks = [t for t in tasks if t.assignee == filter.assignee]
-        if filter.due_before:
-            tasks = [t for t in tasks if t.due_date and t.due_date < filter.due_before]
-        if filter.due_after:
-            tasks = [t for t in tasks if t.due_date and t.due_date > filter.due_after]
-        if filter.tags:
-            tasks = [t for t in tasks if any(tag in t.tags for tag in filter.tags)]
+            return list(self._tasks.values())
+
+        matches = filter.to_predicate()
+        tasks = [t for t in self._tasks.values() if matches(t)]
 
         # Apply pagination
         return tasks[filter.offset : filter.offset + filter.limit]
@@ -48,6 +33,17 @@ class InMemoryTaskRepository:
         self._tasks[task.id.value] = task
         return task
 
+    async def create_many(self, tasks: Sequence[Task]) -> list[Task]:
+        """Create several tasks at once."""
+        new_tasks = {task.id.value: task for task in tasks}
+        if len(new_tasks) != len(tasks):
+            raise ValueError("Duplicate task IDs in batch")
+        for key in new_tasks:
+            if key in self._tasks:
+                raise ValueError(f"Task {key} already exists")
+        self._tasks.update(new_tasks)
+        return list(tasks)
+
     async def update(self, task: Task) -> Task:
         """Update an existing task."""
         if task.id.value not in self._tasks:
@@ -66,6 +62,10 @@ class InMemoryTaskRepository:
         """Check if a task exists."""
         return task_id.value in self._tasks
 
+    async def clear(self) -> None:
+        """Remove all tasks."""
+        self._tasks.clear()
+
 
 class InMemoryCacheRepository:
     """In-memory cache implementation."""
@@ -81,6 +81,10 @@ class InMemoryCacheRepository:
         """Get all cached tasks."""
         return list(self._cache.values())
 
+    async def size(self) -> int:
+        """Count cached tasks without copying them."""
+        return len(self._cache)
+
     async def set(
         self, key: str, task: Task, ttl_seconds: Optional[int] = None
     ) -> None:
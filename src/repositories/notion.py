@@ -102,6 +102,21 @@ class NotionTaskRepository:
         Returns:
             Task if found, None otherwise
         """
+        response = await self._fetch_page(task_id)
+        if response is None:
+            return None
+        return self._page_to_task(response.json())
+
+    async def _fetch_page(self, task_id: TaskId) -> Optional[httpx.Response]:
+        """Fetch the Notion page for a task.
+
+        Args:
+            task_id: Task ID (must be Notion page ID format)
+
+        Returns:
+            Successful response, or None if the page is missing or the
+            request fails
+        """
         # Extract Notion page ID from TaskId
         notion_id = task_id.value
         if notion_id.startswith("notion:"):
@@ -119,8 +134,7 @@ class NotionTaskRepository:
                 return None
 
             response.raise_for_status()
-            page = response.json()
-            return self._page_to_task(page)
+            return response
 
         except httpx.HTTPError:
             return None
@@ -198,29 +212,50 @@ class NotionTaskRepository:
         Returns:
             Created task with Notion ID
         """
-        properties = self._task_to_properties(task)
-
         client = await self._get_client()
         try:
-            response = await client.post(
-                f"{self._base_url}/pages",
-                headers=self._get_headers(),
-                json={
-                    "parent": {"database_id": self._database_id},
-                    "properties": properties,
-                },
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            page = response.json()
+            return await self._create_page(client, task)
+        finally:
+            if self._owns_client and not self._http_client:
+                await client.aclose()
 
-            # Return task with Notion page ID
-            return self._page_to_task(page) or task
+    async def create_many(self, tasks: Sequence[Task]) -> list[Task]:
+        """Create several tasks in Notion database.
+
+        Notion has no bulk page endpoint, so pages are created one request
+        at a time over a single HTTP client.
+
+        Args:
+            tasks: Tasks to create
 
+        Returns:
+            Created tasks with Notion IDs, in input order
+        """
+        client = await self._get_client()
+        try:
+            return [await self._create_page(client, task) for task in tasks]
         finally:
             if self._owns_client and not self._http_client:
                 await client.aclose()
 
+    async def _create_page(self, client: httpx.AsyncClient, task: Task) -> Task:
+        """Create a single Notion page for a task."""
+        properties = self._task_to_properties(task)
+        response = await client.post(
+            f"{self._base_url}/pages",
+            headers=self._get_headers(),
+            json={
+                "parent": {"database_id": self._database_id},
+                "properties": properties,
+            },
+            timeout=10.0,
+        )
+        response.raise_for_status()
+        page = response.json()
+
+        # Return task with Notion page ID
+        return self._page_to_task(page) or task
+
     async def update(self, task: Task) -> Task:
         """Update task in Notion.
 
@@ -302,8 +337,8 @@ class NotionTaskRepository:
         Returns:
             True if exists, False otherwise
         """
-        task = await self.get_by_id(task_id)
-        return task is not None
+        # Only the status code matters; skip converting the page to a Task
+        return await self._fetch_page(task_id) is not None
 
     def _build_query_filter(self, filter: Optional[TaskFilter]) -> dict:
         """Build Notion query filter from TaskFilter.
@@ -1,8 +1,9 @@
 """Service for processing mentions and creating tasks."""
 
 import re
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence
 
 from src.domain.models import (
     Task,
@@ -14,10 +15,51 @@ from src.domain.models import (
 )
 from src.domain.protocols import TaskRepository, WebhookParser
 
+# Single pattern for all inline metadata so the message is scanned once.
+# Group names identify the token kind via ``match.lastgroup``.
+_META_RE = re.compile(
+    r"!(?P<priority>(?i:low|medium|high|urgent))"
+    r"|due:(?P<due>\d{4}-\d{2}-\d{2})(?![^\s#!<])"
+    r"|due:[^\s#!<]*"  # Malformed due token: stripped from the title only
+    r"|#(?P<tag>\w+)"
+    r"|(?P<mention><@\w+>|<@!\d+>)"  # Slack / Discord user mentions
+)
+
+
+def extract_tags_bulk(texts: Sequence[str]) -> list[list[str]]:
+    """Extract #tags from many message texts.
+
+    Intended for re-indexing stored mentions; yields the same tags as
+    MentionService.extract_task_details for each text.
+    """
+    finditer = _META_RE.finditer
+    return [
+        [m.group("tag") for m in finditer(text) if m.lastgroup == "tag"]
+        for text in texts
+    ]
+
 
 class MentionService:
     """Service for processing mentions and creating tasks."""
 
+    _PRIORITY_MAP = {
+        "low": TaskPriority.LOW,
+        "medium": TaskPriority.MEDIUM,
+        "high": TaskPriority.HIGH,
+        "urgent": TaskPriority.URGENT,
+    }
+
+    _SOURCE_MAP = {
+        "slack": TaskSource.SLACK_MENTION,
+        "discord": TaskSource.DISCORD_MENTION,
+    }
+
+    # Platforms recognised by _classify without asking each parser
+    _CLASSIFIED_PLATFORMS = frozenset({"slack", "discord"})
+
+    # Number of recent webhook deliveries remembered for retry detection
+    _DELIVERY_CACHE_SIZE = 4096
+
     def __init__(
         self,
         personal_repository: TaskRepository,
@@ -25,10 +67,29 @@ class MentionService:
     ) -> None:
         self._repo = personal_repository
         self._parsers = {p.platform: p for p in parsers}
+        # Parsers for platforms _classify does not know about
+        self._fallback_parsers = [
+            p for p in parsers if p.platform not in self._CLASSIFIED_PLATFORMS
+        ]
+        self._processed: OrderedDict[str, TaskId] = OrderedDict()
+
+    @staticmethod
+    def _classify(payload: dict) -> Optional[str]:
+        """Guess the source platform from top-level payload keys."""
+        if payload.get("type") == "event_callback":
+            return "slack"
+        if "guild_id" in payload or "channel_id" in payload:
+            return "discord"
+        return None
 
     def get_parser(self, payload: dict) -> Optional[WebhookParser]:
         """Find a parser that can handle the payload."""
-        for parser in self._parsers.values():
+        # Fast path: only the classified parser needs to confirm the payload
+        parser = self._parsers.get(self._classify(payload))
+        if parser is not None and parser.can_parse(payload):
+            return parser
+
+        for parser in self._fallback_parsers:
             if parser.can_parse(payload):
                 return parser
         return None
@@ -43,33 +104,40 @@ class MentionService:
         """
         text = mention.message_text
 
-        # Extract priority (e.g., !high, !urgent)
+        priority_token = None
+        due_token = None
+        tags = []
+        title_parts = []
+        pos = 0
+
+        for match in _META_RE.finditer(text):
+            kind = match.lastgroup
+            if kind == "priority":
+                priority_token = priority_token or match.group("priority")
+            elif kind == "due":
+                # Only the first date token counts (e.g., due:2024-01-15)
+                due_token = due_token or match.group("due")
+            elif kind == "tag":
+                tags.append(match.group("tag"))
+
+            # Strip every metadata token from the title
+            title_parts.append(text[pos : match.start()])
+            pos = match.end()
+
+        title_parts.append(text[pos:])
+        title = " ".join("".join(title_parts).split())  # Normalize whitespace
+
         priority = TaskPriority.MEDIUM
-        priority_match = re.search(r"!(low|medium|high|urgent)", text, re.IGNORECASE)
-        if priority_match:
-            priority = TaskPriority(priority_match.group(1).lower())
+        if priority_token:
+            priority = self._PRIORITY_MAP.get(priority_token.lower(), TaskPriority.MEDIUM)
 
-        # Extract due date (e.g., due:2024-01-15)
         due_date = None
-        due_match = re.search(r"due:(\d{4}-\d{2}-\d{2})", text)
-        if due_match:
+        if due_token:
             try:
-                due_date = datetime.strptime(due_match.group(1), "%Y-%m-%d")
+                due_date = datetime.strptime(due_token, "%Y-%m-%d")
             except ValueError:
                 pass
 
-        # Extract tags (e.g., #bug, #feature)
-        tags = re.findall(r"#(\w+)", text)
-
-        # Clean title (remove metadata)
-        title = text
-        title = re.sub(r"!(low|medium|high|urgent)", "", title, flags=re.IGNORECASE)
-        title = re.sub(r"due:\S+", "", title)
-        title = re.sub(r"#\w+", "", title)
-        title = re.sub(r"<@\w+>", "", title)  # Remove Slack mentions
-        title = re.sub(r"<@!\d+>", "", title)  # Remove Discord mentions
-        title = " ".join(title.split())  # Normalize whitespace
-
         return {
             "title": title or "Task from mention",
             "priority": priority,
@@ -77,18 +145,21 @@ class MentionService:
             "tags": tags,
         }
 
-    async def process_mention(self, mention: Mention) -> Task:
-        """Process a mention and create a task."""
+    def _build_task(self, mention: Mention, now: Optional[datetime] = None) -> Task:
+        """Build (but do not persist) the task for a mention.
+
+        Args:
+            mention: Parsed mention
+            now: Creation timestamp; defaults to the current time
+        """
         details = self.extract_task_details(mention)
 
-        source = (
-            TaskSource.SLACK_MENTION
-            if mention.source_platform == "slack"
-            else TaskSource.DISCORD_MENTION
+        source = self._SOURCE_MAP.get(
+            mention.source_platform, TaskSource.DISCORD_MENTION
         )
 
-        now = datetime.now()
-        task = Task(
+        now = now or datetime.now()
+        return Task(
             id=TaskId.generate(),
             title=details["title"],
             description=f"From {mention.source_platform} by {mention.user_name}:\n\n{mention.message_text}",
@@ -111,13 +182,107 @@ class MentionService:
             },
         )
 
-        return await self._repo.create(task)
+    async def process_mention(
+        self, mention: Mention, now: Optional[datetime] = None
+    ) -> Task:
+        """Process a mention and create a task.
+
+        Args:
+            mention: Parsed mention
+            now: Creation timestamp; defaults to the current time
+        """
+        return await self._repo.create(self._build_task(mention, now))
+
+    @staticmethod
+    def _delivery_key(platform: str, payload: dict) -> Optional[str]:
+        """Build a key identifying a webhook delivery across retries."""
+        if platform == "slack":
+            event = payload.get("event", {})
+            if event.get("ts"):
+                return f"slack:{event.get('channel', '')}:{event['ts']}"
+        elif payload.get("id"):
+            return f"{platform}:{payload['id']}"
+        return None
+
+    async def _find_delivered(self, key: Optional[str]) -> Optional[Task]:
+        """Return the task created by an earlier delivery of the same webhook."""
+        if key is None or key not in self._processed:
+            return None
+        self._processed.move_to_end(key)
+        return await self._repo.get_by_id(self._processed[key])
+
+    def _remember_delivery(self, key: Optional[str], task: Task) -> None:
+        """Record the task created for a webhook delivery."""
+        if key is None:
+            return
+        self._processed[key] = task.id
+        if len(self._processed) > self._DELIVERY_CACHE_SIZE:
+            self._processed.popitem(last=False)
 
     async def process_webhook(self, payload: dict) -> Optional[Task]:
-        """Process a webhook payload end-to-end."""
+        """Process a webhook payload end-to-end.
+
+        Redelivered webhooks (platform retries) return the task created by
+        the first delivery instead of creating a duplicate.
+        """
         parser = self.get_parser(payload)
         if not parser:
             return None
 
+        key = self._delivery_key(parser.platform, payload)
+        existing = await self._find_delivered(key)
+        if existing is not None:
+            return existing
+
+        now = datetime.now()
         mention = parser.parse(payload)
-        return await self.process_mention(mention)
+        task = await self.process_mention(mention, now)
+        self._remember_delivery(key, task)
+        return task
+
+    async def process_webhooks(self, payloads: Sequence[dict]) -> list[Optional[Task]]:
+        """Process a burst of webhook payloads with a single repository write.
+
+        Args:
+            payloads: Raw webhook payloads
+
+        Returns:
+            One entry per payload, in order: the created (or previously
+            delivered) task, or None if no parser handles the payload
+        """
+        now = datetime.now()
+        results: list[Optional[Task]] = [None] * len(payloads)
+        new_tasks: list[Task] = []
+        new_keys: list[Optional[str]] = []
+        # Payload index -> position in new_tasks, including in-batch retries
+        pending: dict[int, int] = {}
+        batch_keys: dict[str, int] = {}
+
+        for index, payload in enumerate(payloads):
+            parser = self.get_parser(payload)
+            if not parser:
+                continue
+
+            key = self._delivery_key(parser.platform, payload)
+            if key is not None and key in batch_keys:
+                pending[index] = batch_keys[key]
+                continue
+
+            existing = await self._find_delivered(key)
+            if existing is not None:
+                results[index] = existing
+                continue
+
+            pending[index] = len(new_tasks)
+            if key is not None:
+                batch_keys[key] = len(new_tasks)
+            new_tasks.append(self._build_task(parser.parse(payload), now))
+            new_keys.append(key)
+
+        created = await self._repo.create_many(new_tasks) if new_tasks else []
+        for key, task in zip(new_keys, created):
+            self._remember_delivery(key, task)
+        for index, position in pending.items():
+            results[index] = created[position]
+
+        return results
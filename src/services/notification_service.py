@@ -202,11 +202,11 @@ class NotificationService:
         today = datetime.now().date()
 
         # Count tasks by status
-        todo_count = sum(1 for t in all_tasks if t.status == TaskStatus.TODO)
-        in_progress_count = sum(1 for t in all_tasks if t.status == TaskStatus.IN_PROGRESS)
+        todo_count = sum(1 for t in all_tasks if t.status is TaskStatus.TODO)
+        in_progress_count = sum(1 for t in all_tasks if t.status is TaskStatus.IN_PROGRESS)
         done_today = sum(
             1 for t in all_tasks
-            if t.status == TaskStatus.DONE
+            if t.status is TaskStatus.DONE
             and t.updated_at.date() == today
         )
 
@@ -214,12 +214,12 @@ class NotificationService:
         due_today = sum(
             1 for t in all_tasks
             if t.due_date and t.due_date.date() == today
-            and t.status != TaskStatus.DONE
+            and t.status is not TaskStatus.DONE
         )
         overdue = sum(
             1 for t in all_tasks
             if t.due_date and t.due_date.date() < today
-            and t.status != TaskStatus.DONE
+            and t.status is not TaskStatus.DONE
         )
 
         message_lines = [
@@ -202,14 +202,15 @@ class TaskSyncService:
             self.SYNC_SOURCE_DB_KEY: self._source_db_name,
         }
 
+        now = datetime.now()
         new_task = replace(
             task_to_create,
             id=TaskId.generate(),
             source=TaskSource.NOTION_PERSONAL,
             external_id=None,
             metadata=new_metadata,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
         )
 
         return await self._dest_repo.create(new_task)
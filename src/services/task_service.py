@@ -46,22 +46,8 @@ class TaskService:
         if filter is None:
             return all_tasks
 
-        result = all_tasks
-
-        if filter.status:
-            result = [t for t in result if t.status in filter.status]
-        if filter.priority:
-            result = [t for t in result if t.priority in filter.priority]
-        if filter.source:
-            result = [t for t in result if t.source in filter.source]
-        if filter.assignee:
-            result = [t for t in result if t.assignee == filter.assignee]
-        if filter.due_before:
-            result = [t for t in result if t.due_date and t.due_date < filter.due_before]
-        if filter.due_after:
-            result = [t for t in result if t.due_date and t.due_date > filter.due_after]
-        if filter.tags:
-            result = [t for t in result if any(tag in t.tags for tag in filter.tags)]
+        matches = filter.to_predicate()
+        result = [t for t in all_tasks if matches(t)]
 
         return result[filter.offset : filter.offset + filter.limit]
 
@@ -134,9 +120,11 @@ class TaskService:
     async def get_tasks_due_today(self) -> Sequence[Task]:
         """Get all tasks due today."""
         all_tasks = await self._cache.get_all()
-        return [t for t in all_tasks if t.is_due_today()]
+        now = datetime.now()
+        return [t for t in all_tasks if t.is_due_today(now)]
 
     async def get_overdue_tasks(self) -> Sequence[Task]:
         """Get all overdue tasks."""
         all_tasks = await self._cache.get_all()
-        return [t for t in all_tasks if t.is_overdue()]
+        now = datetime.now()
+        return [t for t in all_tasks if t.is_overdue(now)]
@@ -1,10 +1,52 @@
-"""Shared pytest fixtures."""
+"""Shared pytest fixtures.
+
+The suite is safe to run with pytest-xdist (``pytest -n auto``): module
+level state in test files is either immutable or, like the task ID pool in
+test_notification_service, created per worker process at import time.
+Class-scoped fixtures are reset by autouse fixtures after every test, so no
+test needs to run serially; ``--dist loadscope`` keeps each class on one
+worker so those fixtures are built once.
+"""
+
+import inspect
 
 import pytest
 from datetime import datetime
 
 from src.domain.models import Task, TaskId, TaskStatus, TaskSource, TaskPriority
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and unavailable on Windows)
+    uvloop = None
+
+
+if uvloop is not None:
+
+    # Hook spec added in pytest-asyncio 1.4 (the dev floor); not marked
+    # optional so an older plugin fails validation instead of ignoring it
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop instead of the default asyncio loop."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+def pytest_collection_modifyitems(config, items):
+    """Fail collection if an async test lacks @pytest.mark.asyncio.
+
+    asyncio_mode is "strict", which would otherwise skip such tests with
+    only a warning.
+    """
+    unmarked = [
+        item.nodeid
+        for item in items
+        if inspect.iscoroutinefunction(getattr(item, "obj", None))
+        and item.get_closest_marker("asyncio") is None
+    ]
+    if unmarked:
+        raise pytest.UsageError(
+            "Async tests missing @pytest.mark.asyncio:\n" + "\n".join(unmarked)
+        )
+
 
 @pytest.fixture
 def sample_task() -> Task:
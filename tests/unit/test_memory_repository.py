@@ -49,6 +49,29 @@ class TestInMemoryTaskRepository:
         with pytest.raises(ValueError, match="already exists"):
             await repository.create(sample_task)
 
+    @pytest.mark.asyncio
+    async def test_create_many(self, repository, sample_task):
+        """Should create a batch of tasks."""
+        other = Task(
+            id=TaskId.generate(),
+            title="Other task",
+            status=TaskStatus.TODO,
+            source=TaskSource.MANUAL,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+        created = await repository.create_many([sample_task, other])
+
+        assert created == [sample_task, other]
+        assert len(await repository.list_tasks()) == 2
+
+    @pytest.mark.asyncio
+    async def test_create_many_with_existing_raises_error(self, repository, sample_task):
+        """Should reject a batch containing an existing task."""
+        await repository.create(sample_task)
+        with pytest.raises(ValueError, match="already exists"):
+            await repository.create_many([sample_task])
+
     @pytest.mark.asyncio
     async def test_get_nonexistent_returns_none(self, repository):
         """Should return None for nonexistent task."""
@@ -303,6 +326,16 @@ class TestInMemoryTaskRepository:
         """Should return False for nonexistent task."""
         assert await repository.exists(TaskId.generate()) is False
 
+    @pytest.mark.asyncio
+    async def test_clear(self, repository, sample_task):
+        """Should remove all tasks."""
+        await repository.create(sample_task)
+
+        await repository.clear()
+
+        assert await repository.list_tasks() == []
+        assert await repository.exists(sample_task.id) is False
+
 
 class TestInMemoryCacheRepository:
     """Tests for InMemoryCacheRepository."""
@@ -362,6 +395,15 @@ class TestInMemoryCacheRepository:
         result = await cache.get_all()
         assert len(result) == 3
 
+    @pytest.mark.asyncio
+    async def test_size(self, cache, sample_task):
+        """Should count cached tasks."""
+        assert await cache.size() == 0
+
+        await cache.set(sample_task.id.value, sample_task)
+
+        assert await cache.size() == 1
+
     @pytest.mark.asyncio
     async def test_set_many(self, cache):
         """Should set multiple tasks at once."""
@@ -1,9 +1,9 @@
 """Tests for MentionService and parsers."""
 
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 
-from src.services.mention_service import MentionService
+from src.services.mention_service import MentionService, extract_tags_bulk
 from src.parsers.slack_parser import SlackWebhookParser
 from src.parsers.discord_parser import DiscordWebhookParser
 from src.repositories.memory import InMemoryTaskRepository
@@ -68,6 +68,7 @@ class TestSlackWebhookParser:
         assert mention.channel_id == "C456"
         assert mention.user_id == "U789"
         assert mention.message_text == "Please review this PR"
+        assert mention.timestamp == datetime.fromtimestamp(1704067200)
         assert "slack.com" in mention.message_url
 
     def test_parse_handles_missing_timestamp(self, parser):
@@ -130,8 +131,21 @@ class TestDiscordWebhookParser:
         assert mention.user_id == "user123"
         assert mention.user_name == "dev_user"
         assert mention.message_text == "Deploy to staging !urgent"
+        assert mention.timestamp == datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
         assert "discord.com" in mention.message_url
 
+    def test_parse_timestamp_with_fraction_and_offset(self, parser):
+        """Should parse Discord timestamps with fractional seconds."""
+        payload = {
+            "type": 0,
+            "channel_id": "456",
+            "timestamp": "2024-01-01T12:00:00.500000+00:00",
+        }
+        mention = parser.parse(payload)
+        assert mention.timestamp == datetime(
+            2024, 1, 1, 12, 0, 0, 500000, tzinfo=timezone.utc
+        )
+
     def test_parse_handles_missing_fields(self, parser):
         """Should handle missing optional fields."""
         payload = {
@@ -179,6 +193,49 @@ class TestMentionService:
         assert parser is not None
         assert parser.platform == "discord"
 
+    def test_get_parser_returns_none_for_unsupported_slack_event(self, service):
+        """Should return None for Slack events that are not mentions."""
+        payload = {
+            "type": "event_callback",
+            "event": {"type": "reaction_added"},
+        }
+        assert service.get_parser(payload) is None
+
+    @pytest.mark.asyncio
+    async def test_get_parser_falls_back_to_custom_parser(self, repository, parsers):
+        """Should consult parsers for other platforms on unclassified payloads."""
+
+        class TeamsParser:
+            platform = "teams"
+
+            def can_parse(self, payload):
+                return payload.get("channelId") == "msteams"
+
+            def parse(self, payload):
+                return Mention(
+                    source_platform="teams",
+                    channel_id="19:general",
+                    channel_name="General",
+                    user_id="29:abc",
+                    user_name="jane",
+                    message_text="Review deck #design",
+                    timestamp=datetime.now(),
+                )
+
+        service = MentionService(repository, [*parsers, TeamsParser()])
+        payload = {"channelId": "msteams"}
+        parser = service.get_parser(payload)
+        assert parser is not None
+        assert parser.platform == "teams"
+
+        task = await service.process_webhook(payload)
+
+        assert task is not None
+        assert task.title == "Review deck"
+        assert task.tags == ["design"]
+        assert task.metadata["source_platform"] == "teams"
+        assert await repository.get_by_id(task.id) is not None
+
     def test_get_parser_returns_none_for_unknown(self, service):
         """Should return None for unknown payloads."""
         payload = {"unknown": "format"}
@@ -255,6 +312,29 @@ class TestMentionService:
         details = service.extract_task_details(mention)
         assert details["due_date"] is None
 
+    @pytest.mark.parametrize(
+        "text,title",
+        [
+            ("Call Bob due:friday", "Call Bob"),
+            ("Ship due:2024-01-15T10:00 now", "Ship now"),
+            ("Ship due:2024-1-5#x", "Ship"),
+        ],
+    )
+    def test_extract_strips_malformed_due_token(self, service, text, title):
+        """Should drop a malformed due token from the title without a date."""
+        mention = Mention(
+            source_platform="slack",
+            channel_id="C123",
+            channel_name="general",
+            user_id="U456",
+            user_name="john",
+            message_text=text,
+            timestamp=datetime.now(),
+        )
+        details = service.extract_task_details(mention)
+        assert details["title"] == title
+        assert details["due_date"] is None
+
     def test_extract_tags(self, service):
         """Should extract tags from text."""
         mention = Mention(
@@ -283,6 +363,20 @@ class TestMentionService:
         details = service.extract_task_details(mention)
         assert details["title"] == "Review PR"
 
+    def test_extract_title_normalizes_whitespace(self, service):
+        """Should collapse whitespace left behind by stripped metadata."""
+        mention = Mention(
+            source_platform="discord",
+            channel_id="C123",
+            channel_name="general",
+            user_id="U456",
+            user_name="john",
+            message_text="  <@!42>  Update\tdocs  #docs   !low\n  today ",
+            timestamp=datetime.now(),
+        )
+        details = service.extract_task_details(mention)
+        assert details["title"] == "Update docs today"
+
     def test_extract_default_title(self, service):
         """Should use default title when text is just metadata."""
         mention = Mention(
@@ -297,6 +391,23 @@ class TestMentionService:
         details = service.extract_task_details(mention)
         assert details["title"] == "Task from mention"
 
+    def test_extract_mixed_metadata(self, service):
+        """Should extract all metadata kinds from a single message."""
+        mention = Mention(
+            source_platform="discord",
+            channel_id="C123",
+            channel_name="general",
+            user_id="U456",
+            user_name="john",
+            message_text="<@!123> Ship release #deploy !URGENT due:2024-02-01 #ops",
+            timestamp=datetime.now(),
+        )
+        details = service.extract_task_details(mention)
+        assert details["title"] == "Ship release"
+        assert details["priority"] == TaskPriority.URGENT
+        assert details["due_date"] == datetime(2024, 2, 1)
+        assert details["tags"] == ["deploy", "ops"]
+
     @pytest.mark.asyncio
     async def test_process_mention_creates_task(self, service, repository):
         """Should create task from mention."""
@@ -318,6 +429,25 @@ class TestMentionService:
         assert "review" in task.tags
         assert await repository.exists(task.id)
 
+    @pytest.mark.asyncio
+    async def test_process_mention_with_adjacent_tokens(self, service, repository):
+        """Should not let a due date swallow tags or priority right after it."""
+        mention = Mention(
+            source_platform="slack",
+            channel_id="C123",
+            channel_name="general",
+            user_id="U456",
+            user_name="john",
+            message_text="fix login due:2024-01-15#ops!high",
+            timestamp=datetime.now(),
+        )
+        task = await service.process_mention(mention)
+
+        assert task.title == "fix login"
+        assert task.due_date == datetime(2024, 1, 15)
+        assert task.tags == ["ops"]
+        assert task.priority == TaskPriority.HIGH
+
     @pytest.mark.asyncio
     async def test_process_mention_stores_metadata(self, service, repository):
         """Should store mention metadata in task."""
@@ -377,9 +507,80 @@ class TestMentionService:
         assert task.source == TaskSource.DISCORD_MENTION
         assert "review" in task.tags
 
+    @pytest.mark.asyncio
+    async def test_process_webhook_redelivery_returns_same_task(
+        self, service, repository
+    ):
+        """Should not create a duplicate task when a webhook is retried."""
+        payload = {
+            "type": 0,
+            "id": "msg123",
+            "channel_id": "channel789",
+            "content": "Code review needed",
+        }
+        first = await service.process_webhook(payload)
+        second = await service.process_webhook(payload)
+
+        assert second.id == first.id
+        assert len(await repository.list_tasks()) == 1
+
+    @pytest.mark.asyncio
+    async def test_process_webhooks_batch(self, service, repository):
+        """Should process a burst of webhooks in payload order."""
+        slack_payload = {
+            "type": "event_callback",
+            "event": {
+                "type": "app_mention",
+                "channel": "C456",
+                "text": "Deploy to prod !urgent",
+                "ts": "1704067200.000000",
+            },
+        }
+        discord_payload = {
+            "type": 0,
+            "id": "msg123",
+            "channel_id": "channel789",
+            "content": "Code review needed #review",
+        }
+        tasks = await service.process_webhooks(
+            [slack_payload, {"unknown": "format"}, discord_payload, slack_payload]
+        )
+
+        assert tasks[0].source == TaskSource.SLACK_MENTION
+        assert tasks[1] is None
+        assert tasks[2].source == TaskSource.DISCORD_MENTION
+        assert tasks[3].id == tasks[0].id
+        assert len(await repository.list_tasks()) == 2
+
     @pytest.mark.asyncio
     async def test_process_webhook_unknown_returns_none(self, service):
         """Should return None for unknown webhook formats."""
         payload = {"unknown": "format"}
         task = await service.process_webhook(payload)
         assert task is None
+
+
+class TestExtractTagsBulk:
+    """Tests for extract_tags_bulk."""
+
+    def test_extracts_tags_per_text(self):
+        """Should return the tags of each text in order."""
+        texts = ["Fix login #bug #auth !high", "No tags here", "<@U123> #review"]
+        assert extract_tags_bulk(texts) == [["bug", "auth"], [], ["review"]]
+
+    def test_matches_extract_task_details(self):
+        """Should agree with the single-mention extraction."""
+        service = MentionService(InMemoryTaskRepository(), [])
+        text = "Ship #deploy due:2024-02-01 !urgent #ops"
+        mention = Mention(
+            source_platform="slack",
+            channel_id="C123",
+            channel_name="general",
+            user_id="U456",
+            user_name="john",
+            message_text=text,
+            timestamp=datetime.now(),
+        )
+        assert extract_tags_bulk([text]) == [
+            service.extract_task_details(mention)["tags"]
+        ]
@@ -62,6 +62,31 @@ class TestTask:
         assert task.assignee is None
         assert task.metadata == {}
 
+    def test_task_timestamps_default_to_one_instant(self):
+        """Omitted timestamps should default to the same creation time."""
+        task = Task(
+            id=TaskId.generate(),
+            title="Test task",
+            status=TaskStatus.TODO,
+            source=TaskSource.MANUAL,
+        )
+        assert isinstance(task.created_at, datetime)
+        assert task.updated_at == task.created_at
+
+    def test_task_uses_slots(self):
+        """Task should not carry a per-instance __dict__."""
+        task = Task(
+            id=TaskId.generate(),
+            title="Test task",
+            status=TaskStatus.TODO,
+            source=TaskSource.MANUAL,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            task.unknown_field = "value"
+
     def test_is_due_today_returns_true_for_today(self):
         """is_due_today should return True for tasks due today."""
         task = Task(
@@ -138,6 +163,22 @@ class TestTask:
         )
         assert task.is_overdue() is False
 
+    def test_due_checks_use_reference_time(self):
+        """is_due_today/is_overdue should honour an explicit reference time."""
+        due = datetime(2024, 1, 15, 14, 0)
+        task = Task(
+            id=TaskId.generate(),
+            title="Fixed due date",
+            status=TaskStatus.TODO,
+            source=TaskSource.MANUAL,
+            due_date=due,
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+        assert task.is_due_today(datetime(2024, 1, 15, 9, 0)) is True
+        assert task.is_overdue(datetime(2024, 1, 15, 9, 0)) is False
+        assert task.is_overdue(datetime(2024, 1, 16)) is True
+
 
 class TestTaskStatus:
     """Tests for TaskStatus enum."""
@@ -179,7 +220,7 @@ class TestTaskSource:
 
 
 class TestMention:
-    """Tests for Mention dataclass."""
+    """Tests for Mention NamedTuple."""
 
     def test_mention_creation(self):
         """Mention should be created with all fields."""
@@ -200,7 +241,7 @@ class TestMention:
         assert mention.user_name == "john"
 
     def test_mention_is_immutable(self):
-        """Mention should be immutable (frozen dataclass)."""
+        """Mention should be immutable (NamedTuple)."""
         mention = Mention(
             source_platform="slack",
             channel_id="C123",
@@ -276,3 +317,20 @@ class TestTaskFilter:
         filter = TaskFilter(due_after=now, due_before=tomorrow)
         assert filter.due_after == now
         assert filter.due_before == tomorrow
+
+    def test_to_predicate_applies_set_criteria(self):
+        """to_predicate should combine only the criteria that are set."""
+        task = Task(
+            id=TaskId.generate(),
+            title="Filtered",
+            status=TaskStatus.TODO,
+            source=TaskSource.MANUAL,
+            priority=TaskPriority.HIGH,
+            tags=["bug"],
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+        )
+        assert TaskFilter().to_predicate()(task) is True
+        assert TaskFilter(status=[TaskStatus.TODO], tags=["bug", "ui"]).to_predicate()(task)
+        assert not TaskFilter(priority=[TaskPriority.LOW]).to_predicate()(task)
+        assert not TaskFilter(due_before=datetime.now()).to_predicate()(task)
@@ -1,8 +1,11 @@
 """Tests for NotificationService and notification senders."""
 
 import pytest
+import pytest_asyncio
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock
+from itertools import cycle
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 import httpx
 
 from src.services.notification_service import NotificationService
@@ -19,127 +22,212 @@ from src.domain.models import (
 )
 
 
-class TestDiscordNotificationSender:
-    """Tests for DiscordNotificationSender."""
+# Fixed timestamp for tests that do not depend on the wall clock
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock HTTP client."""
-        client = AsyncMock(spec=httpx.AsyncClient)
-        return client
+# Pre-generated IDs; tasks only need to be distinct within a test. Each
+# xdist worker imports its own pool, so nothing is shared across processes.
+_ID_POOL = cycle([TaskId.generate() for _ in range(32)])
 
-    @pytest.fixture
-    def sender(self, mock_client) -> DiscordNotificationSender:
-        """Create sender with mock client."""
-        return DiscordNotificationSender(
+# Senders only read status_code from responses
+_RESP_200 = SimpleNamespace(status_code=200)
+_RESP_204 = SimpleNamespace(status_code=204)
+
+
+def _make_task(title, status=TaskStatus.TODO, **kw) -> Task:
+    """Build a task with a pooled ID and fixed timestamps."""
+    kw.setdefault("source", TaskSource.MANUAL)
+    return Task(
+        id=next(_ID_POOL),
+        title=title,
+        status=status,
+        created_at=_NOW,
+        updated_at=_NOW,
+        **kw,
+    )
+
+
+def _fields(mock_post) -> dict:
+    """Map embed field names to values from the last Discord POST."""
+    payload = mock_post.call_args.kwargs["json"]
+    return {f["name"]: f["value"] for f in payload["embeds"][0]["fields"]}
+
+
+class _Recorder:
+    """Async callable that records its arguments and returns a fixed value."""
+
+    def __init__(self, return_value=True) -> None:
+        self.calls = []
+        self.return_value = return_value
+
+    async def __call__(self, notification):
+        self.calls.append(notification)
+        return self.return_value
+
+
+class _StubClient:
+    """Minimal stand-in for httpx.AsyncClient; senders only call post()."""
+
+    def __init__(self) -> None:
+        self.post = AsyncMock()
+
+
+@pytest.fixture(scope="module")
+def basic_notification() -> Notification:
+    """Create a plain notification; senders and the service only read it."""
+    return Notification(
+        title="Test",
+        message="Test",
+        created_at=_NOW,
+    )
+
+
+@pytest.fixture(params=["discord", "print"])
+def any_sender(request):
+    """Create each sender kind with a stub client and its success response."""
+    client = _StubClient()
+    if request.param == "discord":
+        sender = DiscordNotificationSender(
             webhook_url="https://discord.com/api/webhooks/123/abc",
-            http_client=mock_client,
+            http_client=client,
         )
+        return sender, client, _RESP_204
+    sender = PrintWebhookSender(
+        webhook_url="https://print.local/webhook",
+        api_key="test-api-key",
+        http_client=client,
+    )
+    return sender, client, _RESP_200
 
-    def test_channel_name(self, sender):
-        """Should return 'discord' as channel name."""
-        assert sender.channel_name == "discord"
+
+class TestNotificationSenders:
+    """Tests shared by all notification senders."""
 
     @pytest.mark.asyncio
-    async def test_send_success(self, sender, mock_client):
+    async def test_send_success(self, any_sender, basic_notification):
         """Should return True on successful send."""
-        mock_response = MagicMock()
-        mock_response.status_code = 204
-        mock_client.post.return_value = mock_response
+        sender, client, ok_response = any_sender
+        client.post.return_value = ok_response
 
-        notification = Notification(
-            title="Test Notification",
-            message="Test message",
-            created_at=datetime.now(),
-        )
-
-        result = await sender.send(notification)
+        result = await sender.send(basic_notification)
 
         assert result is True
-        mock_client.post.assert_called_once()
+        assert client.post.call_count == 1
 
     @pytest.mark.asyncio
-    async def test_send_failure(self, sender, mock_client):
+    async def test_send_failure(self, any_sender, basic_notification):
         """Should return False on HTTP error."""
-        mock_client.post.side_effect = httpx.HTTPError("Connection failed")
+        sender, client, _ = any_sender
+        client.post.side_effect = httpx.HTTPError("Connection failed")
 
-        notification = Notification(
-            title="Test",
-            message="Test",
-            created_at=datetime.now(),
-        )
-
-        result = await sender.send(notification)
+        result = await sender.send(basic_notification)
 
         assert result is False
 
+
+class TestDiscordNotificationSender:
+    """Tests for DiscordNotificationSender."""
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_client(cls):
+        """Create stub HTTP client shared by the tests in this class."""
+        return _StubClient()
+
+    @pytest.fixture(autouse=True)
+    def _reset_client(self, mock_client):
+        """Clear recorded calls and canned responses after each test."""
+        yield
+        mock_client.post.reset_mock(return_value=True, side_effect=True)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sender(cls, mock_client) -> DiscordNotificationSender:
+        """Create sender with mock client."""
+        return DiscordNotificationSender(
+            webhook_url="https://discord.com/api/webhooks/123/abc",
+            http_client=mock_client,
+        )
+
+    def test_channel_name(self, sender):
+        """Should return 'discord' as channel name."""
+        assert sender.channel_name == "discord"
+
     @pytest.mark.asyncio
-    async def test_send_with_priority(self, sender, mock_client):
+    @pytest.mark.parametrize(
+        "priority,expected",
+        [
+            (TaskPriority.LOW, "Low"),
+            (TaskPriority.MEDIUM, "Medium"),
+            (TaskPriority.HIGH, "High"),
+            (TaskPriority.URGENT, "Urgent"),
+        ],
+    )
+    async def test_send_with_priority(self, sender, mock_client, priority, expected):
         """Should include priority in embed."""
-        mock_response = MagicMock()
-        mock_response.status_code = 204
-        mock_client.post.return_value = mock_response
+        mock_client.post.return_value = _RESP_204
 
         notification = Notification(
-            title="Urgent Task",
-            message="This is urgent",
-            priority=TaskPriority.URGENT,
-            created_at=datetime.now(),
+            title="Prioritized Task",
+            message="Has a priority",
+            priority=priority,
+            created_at=_NOW,
         )
 
         await sender.send(notification)
 
-        call_args = mock_client.post.call_args
-        payload = call_args.kwargs["json"]
-        fields = payload["embeds"][0]["fields"]
-
-        priority_field = next(f for f in fields if f["name"] == "Priority")
-        assert priority_field["value"] == "Urgent"
+        assert _fields(mock_client.post)["Priority"] == expected
 
     @pytest.mark.asyncio
     async def test_send_with_due_date(self, sender, mock_client):
         """Should include due date in embed."""
-        mock_response = MagicMock()
-        mock_response.status_code = 204
-        mock_client.post.return_value = mock_response
+        mock_client.post.return_value = _RESP_204
 
         due_date = datetime(2024, 1, 15, 14, 30)
         notification = Notification(
             title="Task",
             message="Message",
             due_date=due_date,
-            created_at=datetime.now(),
+            created_at=_NOW,
         )
 
         await sender.send(notification)
 
-        call_args = mock_client.post.call_args
-        payload = call_args.kwargs["json"]
-        fields = payload["embeds"][0]["fields"]
-
-        due_field = next(f for f in fields if f["name"] == "Due Date")
-        assert "2024-01-15" in due_field["value"]
-
-    def test_color_for_priority(self, sender):
+        assert "2024-01-15" in _fields(mock_client.post)["Due Date"]
+
+    @pytest.mark.parametrize(
+        "priority,color",
+        [
+            (TaskPriority.LOW, 0x2ECC71),
+            (TaskPriority.MEDIUM, 0x3498DB),
+            (TaskPriority.HIGH, 0xF39C12),
+            (TaskPriority.URGENT, 0xE74C3C),
+            (None, 0x808080),
+        ],
+    )
+    def test_color_for_priority(self, sender, priority, color):
         """Should return correct colors for priorities."""
-        assert sender._get_color_for_priority(TaskPriority.LOW) == 0x2ECC71
-        assert sender._get_color_for_priority(TaskPriority.MEDIUM) == 0x3498DB
-        assert sender._get_color_for_priority(TaskPriority.HIGH) == 0xF39C12
-        assert sender._get_color_for_priority(TaskPriority.URGENT) == 0xE74C3C
-        assert sender._get_color_for_priority(None) == 0x808080
+        assert sender._get_color_for_priority(priority) == color
 
 
 class TestPrintWebhookSender:
     """Tests for PrintWebhookSender."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock HTTP client."""
-        client = AsyncMock(spec=httpx.AsyncClient)
-        return client
-
-    @pytest.fixture
-    def sender(self, mock_client) -> PrintWebhookSender:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_client(cls):
+        """Create stub HTTP client shared by the tests in this class."""
+        return _StubClient()
+
+    @pytest.fixture(autouse=True)
+    def _reset_client(self, mock_client):
+        """Clear recorded calls and canned responses after each test."""
+        yield
+        mock_client.post.reset_mock(return_value=True, side_effect=True)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sender(cls, mock_client) -> PrintWebhookSender:
         """Create sender with mock client."""
         return PrintWebhookSender(
             webhook_url="https://print.local/webhook",
@@ -152,69 +240,26 @@ class TestPrintWebhookSender:
         assert sender.channel_name == "print"
 
     @pytest.mark.asyncio
-    async def test_send_success(self, sender, mock_client):
-        """Should return True on successful send."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_client.post.return_value = mock_response
-
-        notification = Notification(
-            title="Print Task",
-            message="Print this message",
-            created_at=datetime.now(),
-        )
-
-        result = await sender.send(notification)
-
-        assert result is True
-        mock_client.post.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_send_includes_api_key(self, sender, mock_client):
+    async def test_send_includes_api_key(self, sender, mock_client, basic_notification):
         """Should include API key in headers."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_client.post.return_value = mock_response
-
-        notification = Notification(
-            title="Test",
-            message="Test",
-            created_at=datetime.now(),
-        )
+        mock_client.post.return_value = _RESP_200
 
-        await sender.send(notification)
+        await sender.send(basic_notification)
 
         call_args = mock_client.post.call_args
         headers = call_args.kwargs["headers"]
         assert headers["X-API-Key"] == "test-api-key"
 
-    @pytest.mark.asyncio
-    async def test_send_failure(self, sender, mock_client):
-        """Should return False on HTTP error."""
-        mock_client.post.side_effect = httpx.HTTPError("Connection failed")
-
-        notification = Notification(
-            title="Test",
-            message="Test",
-            created_at=datetime.now(),
-        )
-
-        result = await sender.send(notification)
-
-        assert result is False
-
     @pytest.mark.asyncio
     async def test_payload_includes_formatted_text(self, sender, mock_client):
         """Should include formatted text for printing."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_client.post.return_value = mock_response
+        mock_client.post.return_value = _RESP_200
 
         notification = Notification(
             title="Important Task",
             message="Do this thing",
             priority=TaskPriority.HIGH,
-            created_at=datetime.now(),
+            created_at=_NOW,
         )
 
         await sender.send(notification)
@@ -248,25 +293,26 @@ class TestPrintWebhookSender:
 class TestNotificationService:
     """Tests for NotificationService."""
 
-    @pytest.fixture
-    def cache(self) -> InMemoryCacheRepository:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def cache(cls) -> InMemoryCacheRepository:
         return InMemoryCacheRepository()
 
+    @pytest_asyncio.fixture(autouse=True)
+    async def _clear_cache(self, cache):
+        """Empty the shared cache after each test."""
+        yield
+        await cache.clear()
+
     @pytest.fixture
     def mock_discord_sender(self):
         """Create mock Discord sender."""
-        sender = AsyncMock()
-        sender.channel_name = "discord"
-        sender.send = AsyncMock(return_value=True)
-        return sender
+        return SimpleNamespace(channel_name="discord", send=_Recorder(True))
 
     @pytest.fixture
     def mock_print_sender(self):
         """Create mock print sender."""
-        sender = AsyncMock()
-        sender.channel_name = "print"
-        sender.send = AsyncMock(return_value=True)
-        return sender
+        return SimpleNamespace(channel_name="print", send=_Recorder(True))
 
     @pytest.fixture
     def service(self, cache, mock_discord_sender, mock_print_sender) -> NotificationService:
@@ -285,8 +331,7 @@ class TestNotificationService:
     def test_add_sender(self, cache):
         """Should add sender to list."""
         service = NotificationService(cache, [])
-        mock_sender = AsyncMock()
-        mock_sender.channel_name = "new"
+        mock_sender = SimpleNamespace(channel_name="new")
 
         service.add_sender(mock_sender)
 
@@ -308,60 +353,43 @@ class TestNotificationService:
 
     @pytest.mark.asyncio
     async def test_send_notification_all_channels(
-        self, service, mock_discord_sender, mock_print_sender
+        self, service, mock_discord_sender, mock_print_sender, basic_notification
     ):
         """Should send to all channels when none specified."""
-        notification = Notification(
-            title="Test",
-            message="Test",
-            created_at=datetime.now(),
-        )
-
-        results = await service.send_notification(notification)
+        results = await service.send_notification(basic_notification)
 
         assert results["discord"] is True
         assert results["print"] is True
-        mock_discord_sender.send.assert_called_once()
-        mock_print_sender.send.assert_called_once()
+        assert len(mock_discord_sender.send.calls) == 1
+        assert len(mock_print_sender.send.calls) == 1
 
     @pytest.mark.asyncio
     async def test_send_notification_specific_channels(
-        self, service, mock_discord_sender, mock_print_sender
+        self, service, mock_discord_sender, mock_print_sender, basic_notification
     ):
         """Should send only to specified channels."""
-        notification = Notification(
-            title="Test",
-            message="Test",
-            created_at=datetime.now(),
-        )
-
-        results = await service.send_notification(notification, channels=["discord"])
+        results = await service.send_notification(basic_notification, channels=["discord"])
 
         assert "discord" in results
         assert "print" not in results
-        mock_discord_sender.send.assert_called_once()
-        mock_print_sender.send.assert_not_called()
+        assert len(mock_discord_sender.send.calls) == 1
+        assert mock_print_sender.send.calls == []
 
     @pytest.mark.asyncio
     async def test_send_task_reminder(self, service, mock_discord_sender):
         """Should send reminder notification for task."""
-        task = Task(
-            id=TaskId.generate(),
-            title="Review PR",
+        task = _make_task(
+            "Review PR",
             description="Review the pull request",
-            status=TaskStatus.TODO,
             source=TaskSource.SLACK_MENTION,
             priority=TaskPriority.HIGH,
             due_date=datetime.now() + timedelta(hours=2),
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
         )
 
         results = await service.send_task_reminder(task)
 
         assert results["discord"] is True
-        call_args = mock_discord_sender.send.call_args
-        notification = call_args[0][0]
+        notification = mock_discord_sender.send.calls[-1]
         assert "Review PR" in notification.title
         assert notification.priority == TaskPriority.HIGH
 
@@ -371,23 +399,10 @@ class TestNotificationService:
     ):
         """Should send notifications for tasks due today."""
         today = datetime.now()
-        due_today = Task(
-            id=TaskId.generate(),
-            title="Due Today Task",
-            status=TaskStatus.TODO,
-            source=TaskSource.MANUAL,
-            due_date=today,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        due_tomorrow = Task(
-            id=TaskId.generate(),
-            title="Due Tomorrow",
-            status=TaskStatus.TODO,
-            source=TaskSource.MANUAL,
+        due_today = _make_task("Due Today Task", due_date=today)
+        due_tomorrow = _make_task(
+            "Due Tomorrow",
             due_date=today + timedelta(days=1),
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
         )
         await cache.set(due_today.id.value, due_today)
         await cache.set(due_tomorrow.id.value, due_tomorrow)
@@ -403,15 +418,7 @@ class TestNotificationService:
     ):
         """Should not send notifications for completed tasks."""
         today = datetime.now()
-        done_task = Task(
-            id=TaskId.generate(),
-            title="Done Task",
-            status=TaskStatus.DONE,
-            source=TaskSource.MANUAL,
-            due_date=today,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
+        done_task = _make_task("Done Task", TaskStatus.DONE, due_date=today)
         await cache.set(done_task.id.value, done_task)
 
         results = await service.send_due_notifications()
@@ -424,15 +431,7 @@ class TestNotificationService:
     ):
         """Should send notifications for overdue tasks."""
         yesterday = datetime.now() - timedelta(days=1)
-        overdue_task = Task(
-            id=TaskId.generate(),
-            title="Overdue Task",
-            status=TaskStatus.TODO,
-            source=TaskSource.MANUAL,
-            due_date=yesterday,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
+        overdue_task = _make_task("Overdue Task", due_date=yesterday)
         await cache.set(overdue_task.id.value, overdue_task)
 
         results = await service.send_overdue_notifications()
@@ -446,30 +445,9 @@ class TestNotificationService:
         """Should send daily summary with task counts."""
         # Add various tasks
         tasks = [
-            Task(
-                id=TaskId.generate(),
-                title="TODO Task",
-                status=TaskStatus.TODO,
-                source=TaskSource.MANUAL,
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
-            ),
-            Task(
-                id=TaskId.generate(),
-                title="In Progress Task",
-                status=TaskStatus.IN_PROGRESS,
-                source=TaskSource.MANUAL,
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
-            ),
-            Task(
-                id=TaskId.generate(),
-                title="Done Task",
-                status=TaskStatus.DONE,
-                source=TaskSource.MANUAL,
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
-            ),
+            _make_task("TODO Task"),
+            _make_task("In Progress Task", TaskStatus.IN_PROGRESS),
+            _make_task("Done Task", TaskStatus.DONE),
         ]
         for task in tasks:
             await cache.set(task.id.value, task)
@@ -477,8 +455,7 @@ class TestNotificationService:
         results = await service.send_daily_summary()
 
         assert results["discord"] is True
-        call_args = mock_discord_sender.send.call_args
-        notification = call_args[0][0]
+        notification = mock_discord_sender.send.calls[-1]
         assert "Daily Task Summary" in notification.title
         assert "TODO: 1" in notification.message
         assert "In Progress: 1" in notification.message
@@ -486,18 +463,14 @@ class TestNotificationService:
     @pytest.mark.asyncio
     async def test_task_to_notification_with_metadata(self, service, cache):
         """Should include source info from task metadata."""
-        task = Task(
-            id=TaskId.generate(),
-            title="Task from Slack",
-            status=TaskStatus.TODO,
+        task = _make_task(
+            "Task from Slack",
             source=TaskSource.SLACK_MENTION,
             metadata={
                 "source_platform": "slack",
                 "source_user_name": "john",
                 "message_url": "https://slack.com/...",
             },
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
         )
 
         notification = service._task_to_notification(
@@ -511,19 +484,13 @@ class TestNotificationService:
 
     @pytest.mark.asyncio
     async def test_send_with_partial_failure(
-        self, service, mock_discord_sender, mock_print_sender
+        self, service, mock_discord_sender, mock_print_sender, basic_notification
     ):
         """Should report partial success when some senders fail."""
         mock_discord_sender.send.return_value = True
         mock_print_sender.send.return_value = False
 
-        notification = Notification(
-            title="Test",
-            message="Test",
-            created_at=datetime.now(),
-        )
-
-        results = await service.send_notification(notification)
+        results = await service.send_notification(basic_notification)
 
         assert results["discord"] is True
         assert results["print"] is False
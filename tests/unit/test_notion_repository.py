@@ -1,8 +1,9 @@
-"""Tests for NotionTaskRepository with mocked HTTP client."""
+"""Tests for NotionTaskRepository with a mocked HTTP transport."""
 
+import json
 import pytest
+import pytest_asyncio
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
 import httpx
 
 from src.repositories.notion import NotionTaskRepository
@@ -16,130 +17,233 @@ from src.domain.models import (
 )
 
 
+# IDs of the sample page and of a page Notion reports as missing
+_PAGE_ID = TaskId.from_notion("page-123")
+_MISSING_ID = TaskId.from_notion("nonexistent")
+
+# Shared, never mutated: the repository only reads pages
+_SAMPLE_NOTION_PAGE = {
+    "id": "page-123",
+    "created_time": "2024-01-01T10:00:00.000Z",
+    "last_edited_time": "2024-01-02T12:00:00.000Z",
+    "properties": {
+        "Name": {
+            "title": [{"text": {"content": "Test Task"}}]
+        },
+        "Status": {
+            "status": {"name": "In progress"}
+        },
+        "Priority": {
+            "select": {"name": "High"}
+        },
+        "Description": {
+            "rich_text": [{"text": {"content": "Task description"}}]
+        },
+        "Due": {
+            "date": {"start": "2024-01-15T14:00:00"}
+        },
+        "Tags": {
+            "multi_select": [{"name": "bug"}, {"name": "urgent"}]
+        },
+        "Metadata": {
+            "rich_text": [{"text": {"content": "{\"source_url\": \"https://slack.com/...\"}"}}]
+        },
+    },
+}
+
+
+# Properties _task_to_properties should produce for the task built in
+# test_task_to_properties
+_EXPECTED_PROPERTIES = {
+    "Name": {"title": [{"text": {"content": "New Task"}}]},
+    "Status": {"status": {"name": "In progress"}},
+    "Priority": {"select": {"name": "High"}},
+    "Description": {"rich_text": [{"text": {"content": "Task description"}}]},
+    "Due": {"date": {"start": "2024-01-15T14:00:00"}},
+    "Tags": {"multi_select": [{"name": "feature"}, {"name": "review"}]},
+    "Metadata": {
+        "rich_text": [{"text": {"content": "{\"source_url\": \"https://example.com\"}"}}]
+    },
+}
+
+
+class _NotionTransport:
+    """MockTransport handler that replays queued responses in order.
+
+    The last queued response answers any further requests, and queued
+    exceptions are raised instead of returned. Every request is recorded
+    so tests can inspect what the repository sent.
+    """
+
+    def __init__(self) -> None:
+        self.queue = []
+        self.requests = []
+
+    def reset(self) -> None:
+        self.queue.clear()
+        self.requests.clear()
+
+    def respond(self, status_code: int = 200, payload=None) -> None:
+        """Queue a response, with a JSON body when payload is given."""
+        if payload is None:
+            self.queue.append(httpx.Response(status_code))
+        else:
+            self.queue.append(httpx.Response(status_code, json=payload))
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        response = self.queue.pop(0) if len(self.queue) > 1 else self.queue[0]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    @property
+    def calls(self) -> list[tuple[str, str]]:
+        """Method and URL path of each recorded request."""
+        return [(r.method, r.url.path) for r in self.requests]
+
+    def sent_json(self, index: int = -1) -> dict:
+        """Decode the JSON body of a recorded request."""
+        return json.loads(self.requests[index].content)
+
+
+@pytest.fixture(scope="module")
+def sample_notion_page() -> dict:
+    """Provide the shared sample Notion page response."""
+    return _SAMPLE_NOTION_PAGE
+
+
+@pytest.fixture(scope="module")
+def sync_repository() -> NotionTaskRepository:
+    """Create a repository without an HTTP client for conversion tests."""
+    return NotionTaskRepository(
+        api_key="test-api-key",
+        database_id="test-database-id",
+        source=TaskSource.NOTION_TEAM,
+    )
+
+
 class TestNotionTaskRepository:
     """Tests for NotionTaskRepository."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create mock HTTP client."""
-        return AsyncMock(spec=httpx.AsyncClient)
-
-    @pytest.fixture
-    def repository(self, mock_client) -> NotionTaskRepository:
-        """Create repository with mock client."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def transport(cls) -> _NotionTransport:
+        """Create the response queue shared by the class's HTTP client."""
+        return _NotionTransport()
+
+    @pytest_asyncio.fixture(scope="class")
+    @classmethod
+    async def http_client(cls, transport):
+        """Create a real client on a mock transport, closed after the class."""
+        client = httpx.AsyncClient(transport=httpx.MockTransport(transport))
+        yield client
+        await client.aclose()
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def repository(cls, http_client) -> NotionTaskRepository:
+        """Create repository backed by the class's HTTP client."""
         return NotionTaskRepository(
             api_key="test-api-key",
             database_id="test-database-id",
             source=TaskSource.NOTION_TEAM,
-            http_client=mock_client,
+            http_client=http_client,
         )
 
-    @pytest.fixture
-    def sample_notion_page(self) -> dict:
-        """Create sample Notion page response."""
-        return {
-            "id": "page-123",
-            "created_time": "2024-01-01T10:00:00.000Z",
-            "last_edited_time": "2024-01-02T12:00:00.000Z",
-            "properties": {
-                "Name": {
-                    "title": [{"text": {"content": "Test Task"}}]
-                },
-                "Status": {
-                    "status": {"name": "In progress"}
-                },
-                "Priority": {
-                    "select": {"name": "High"}
-                },
-                "Description": {
-                    "rich_text": [{"text": {"content": "Task description"}}]
-                },
-                "Due": {
-                    "date": {"start": "2024-01-15T14:00:00"}
-                },
-                "Tags": {
-                    "multi_select": [{"name": "bug"}, {"name": "urgent"}]
-                },
-                "Metadata": {
-                    "rich_text": [{"text": {"content": "{\"source_url\": \"https://slack.com/...\"}"}}]
-                },
-            },
-        }
-
-    def test_status_mapping(self, repository):
+    @pytest.fixture(autouse=True)
+    def _reset_transport(self, transport):
+        """Drop queued responses and recorded requests between tests."""
+        yield
+        transport.reset()
+
+    @pytest.mark.parametrize(
+        "status,notion",
+        [
+            (TaskStatus.TODO, "Not started"),
+            (TaskStatus.IN_PROGRESS, "In progress"),
+            (TaskStatus.DONE, "Done"),
+            (TaskStatus.BLOCKED, "Blocked"),
+        ],
+    )
+    def test_status_mapping(self, sync_repository, status, notion):
         """Should correctly map status values."""
-        assert repository.STATUS_TO_NOTION[TaskStatus.TODO] == "Not started"
-        assert repository.STATUS_TO_NOTION[TaskStatus.IN_PROGRESS] == "In progress"
-        assert repository.STATUS_TO_NOTION[TaskStatus.DONE] == "Done"
-        assert repository.STATUS_TO_NOTION[TaskStatus.BLOCKED] == "Blocked"
-
-    def test_priority_mapping(self, repository):
+        assert sync_repository._status_to_notion[status] == notion
+
+    @pytest.mark.parametrize(
+        "priority,notion",
+        [
+            (TaskPriority.LOW, "Low"),
+            (TaskPriority.MEDIUM, "Medium"),
+            (TaskPriority.HIGH, "High"),
+            (TaskPriority.URGENT, "Urgent"),
+        ],
+    )
+    def test_priority_mapping(self, sync_repository, priority, notion):
         """Should correctly map priority values."""
-        assert repository.PRIORITY_TO_NOTION[TaskPriority.LOW] == "Low"
-        assert repository.PRIORITY_TO_NOTION[TaskPriority.MEDIUM] == "Medium"
-        assert repository.PRIORITY_TO_NOTION[TaskPriority.HIGH] == "High"
-        assert repository.PRIORITY_TO_NOTION[TaskPriority.URGENT] == "Urgent"
-
-    def test_page_to_task(self, repository, sample_notion_page):
-        """Should convert Notion page to Task."""
-        task = repository._page_to_task(sample_notion_page)
-
-        assert task is not None
-        assert task.id.value == "notion:page-123"
-        assert task.title == "Test Task"
-        assert task.status == TaskStatus.IN_PROGRESS
-        assert task.priority == TaskPriority.HIGH
-        assert task.description == "Task description"
-        assert task.due_date == datetime(2024, 1, 15, 14, 0)
-        assert task.tags == ["bug", "urgent"]
-        assert task.metadata.get("source_url") == "https://slack.com/..."
-
-    def test_page_to_task_minimal(self, repository):
-        """Should handle minimal Notion page."""
-        minimal_page = {
-            "id": "page-456",
-            "created_time": "2024-01-01T10:00:00.000Z",
-            "last_edited_time": "2024-01-01T10:00:00.000Z",
-            "properties": {
-                "Name": {
-                    "title": [{"text": {"content": "Minimal Task"}}]
+        assert sync_repository._priority_to_notion[priority] == notion
+
+    @pytest.mark.parametrize(
+        "page,expected",
+        [
+            pytest.param(
+                _SAMPLE_NOTION_PAGE,
+                {
+                    "id": _PAGE_ID,
+                    "title": "Test Task",
+                    "status": TaskStatus.IN_PROGRESS,
+                    "priority": TaskPriority.HIGH,
+                    "description": "Task description",
+                    "due_date": datetime(2024, 1, 15, 14, 0),
+                    "tags": ["bug", "urgent"],
+                    "metadata": {"source_url": "https://slack.com/..."},
                 },
-                "Status": {
-                    "status": {"name": "Not started"}
+                id="full",
+            ),
+            pytest.param(
+                {
+                    "id": "page-456",
+                    "created_time": "2024-01-01T10:00:00.000Z",
+                    "last_edited_time": "2024-01-01T10:00:00.000Z",
+                    "properties": {
+                        "Name": {"title": [{"text": {"content": "Minimal Task"}}]},
+                        "Status": {"status": {"name": "Not started"}},
+                        "Priority": {"select": None},
+                    },
                 },
-                "Priority": {
-                    "select": None
+                {
+                    "title": "Minimal Task",
+                    "status": TaskStatus.TODO,
+                    "priority": TaskPriority.MEDIUM,
+                    "description": None,
+                    "due_date": None,
                 },
-            },
-        }
-
-        task = repository._page_to_task(minimal_page)
+                id="minimal",
+            ),
+            pytest.param(
+                {
+                    "id": "page-789",
+                    "created_time": "2024-01-01T10:00:00.000Z",
+                    "last_edited_time": "2024-01-01T10:00:00.000Z",
+                    "properties": {
+                        "Name": {"title": [{"text": {"content": "Date Task"}}]},
+                        "Status": {"status": {"name": "Not started"}},
+                        "Due": {"date": {"start": "2024-01-20"}},
+                    },
+                },
+                {"due_date": datetime(2024, 1, 20)},
+                id="date_only",
+            ),
+        ],
+    )
+    def test_page_to_task(self, sync_repository, page, expected):
+        """Should convert Notion pages, filling defaults for missing fields."""
+        task = sync_repository._page_to_task(page)
 
         assert task is not None
-        assert task.title == "Minimal Task"
-        assert task.status == TaskStatus.TODO
-        assert task.priority == TaskPriority.MEDIUM
-        assert task.description is None
-        assert task.due_date is None
-
-    def test_page_to_task_date_only(self, repository):
-        """Should handle date-only due dates."""
-        page = {
-            "id": "page-789",
-            "created_time": "2024-01-01T10:00:00.000Z",
-            "last_edited_time": "2024-01-01T10:00:00.000Z",
-            "properties": {
-                "Name": {"title": [{"text": {"content": "Date Task"}}]},
-                "Status": {"status": {"name": "Not started"}},
-                "Due": {"date": {"start": "2024-01-20"}},
-            },
-        }
-
-        task = repository._page_to_task(page)
-
-        assert task.due_date == datetime(2024, 1, 20)
+        assert {k: getattr(task, k) for k in expected} == expected
 
-    def test_task_to_properties(self, repository):
+    def test_task_to_properties(self, sync_repository):
         """Should convert Task to Notion properties."""
         task = Task(
             id=TaskId.generate(),
@@ -155,61 +259,46 @@ class TestNotionTaskRepository:
             updated_at=datetime.now(),
         )
 
-        properties = repository._task_to_properties(task)
+        properties = sync_repository._task_to_properties(task)
 
-        assert properties["Name"]["title"][0]["text"]["content"] == "New Task"
-        assert properties["Status"]["status"]["name"] == "In progress"
-        assert properties["Priority"]["select"]["name"] == "High"
-        assert properties["Description"]["rich_text"][0]["text"]["content"] == "Task description"
-        assert properties["Due"]["date"]["start"] is not None
-        assert len(properties["Tags"]["multi_select"]) == 2
+        assert properties == _EXPECTED_PROPERTIES
 
     @pytest.mark.asyncio
-    async def test_get_by_id_found(self, repository, mock_client, sample_notion_page):
+    async def test_get_by_id_found(self, repository, transport, sample_notion_page):
         """Should return task when found."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_notion_page
-        mock_response.raise_for_status = MagicMock()
-        mock_client.get.return_value = mock_response
+        transport.respond(payload=sample_notion_page)
 
-        task = await repository.get_by_id(TaskId("notion:page-123"))
+        task = await repository.get_by_id(_PAGE_ID)
 
         assert task is not None
         assert task.title == "Test Task"
-        mock_client.get.assert_called_once()
+        assert transport.calls == [("GET", "/v1/pages/page-123")]
 
     @pytest.mark.asyncio
-    async def test_get_by_id_not_found(self, repository, mock_client):
+    async def test_get_by_id_not_found(self, repository, transport):
         """Should return None when not found."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_client.get.return_value = mock_response
+        transport.respond(404)
 
-        task = await repository.get_by_id(TaskId("notion:nonexistent"))
+        task = await repository.get_by_id(_MISSING_ID)
 
         assert task is None
 
     @pytest.mark.asyncio
-    async def test_get_by_id_http_error(self, repository, mock_client):
+    async def test_get_by_id_http_error(self, repository, transport):
         """Should return None on HTTP error."""
-        mock_client.get.side_effect = httpx.HTTPError("Connection failed")
+        transport.queue.append(httpx.ConnectError("Connection failed"))
 
-        task = await repository.get_by_id(TaskId("notion:page-123"))
+        task = await repository.get_by_id(_PAGE_ID)
 
         assert task is None
 
     @pytest.mark.asyncio
-    async def test_list_tasks(self, repository, mock_client, sample_notion_page):
+    async def test_list_tasks(self, repository, transport, sample_notion_page):
         """Should list tasks from database."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
+        transport.respond(payload={
             "results": [sample_notion_page],
             "has_more": False,
-        }
-        mock_response.raise_for_status = MagicMock()
-        mock_client.post.return_value = mock_response
+        })
 
         tasks = await repository.list_tasks()
 
@@ -217,7 +306,7 @@ class TestNotionTaskRepository:
         assert tasks[0].title == "Test Task"
 
     @pytest.mark.asyncio
-    async def test_list_tasks_with_pagination(self, repository, mock_client):
+    async def test_list_tasks_with_pagination(self, repository, transport):
         """Should handle pagination."""
         page1 = {
             "id": "page-1",
@@ -238,39 +327,24 @@ class TestNotionTaskRepository:
             },
         }
 
-        response1 = MagicMock()
-        response1.status_code = 200
-        response1.json.return_value = {
+        transport.respond(payload={
             "results": [page1],
             "has_more": True,
             "next_cursor": "cursor-123",
-        }
-        response1.raise_for_status = MagicMock()
-
-        response2 = MagicMock()
-        response2.status_code = 200
-        response2.json.return_value = {
-            "results": [page2],
-            "has_more": False,
-        }
-        response2.raise_for_status = MagicMock()
-
-        mock_client.post.side_effect = [response1, response2]
+        })
+        transport.respond(payload={"results": [page2], "has_more": False})
 
         tasks = await repository.list_tasks()
 
         assert len(tasks) == 2
         assert tasks[0].title == "Task 1"
         assert tasks[1].title == "Task 2"
+        assert transport.sent_json(1)["start_cursor"] == "cursor-123"
 
     @pytest.mark.asyncio
-    async def test_list_tasks_with_filter(self, repository, mock_client):
+    async def test_list_tasks_with_filter(self, repository, transport):
         """Should build filter query."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"results": [], "has_more": False}
-        mock_response.raise_for_status = MagicMock()
-        mock_client.post.return_value = mock_response
+        transport.respond(payload={"results": [], "has_more": False})
 
         filter = TaskFilter(
             status=[TaskStatus.TODO],
@@ -278,18 +352,13 @@ class TestNotionTaskRepository:
         )
         await repository.list_tasks(filter)
 
-        call_args = mock_client.post.call_args
-        body = call_args.kwargs["json"]
+        body = transport.sent_json()
         assert "filter" in body
 
     @pytest.mark.asyncio
-    async def test_create_task(self, repository, mock_client, sample_notion_page):
+    async def test_create_task(self, repository, transport, sample_notion_page):
         """Should create task in Notion."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_notion_page
-        mock_response.raise_for_status = MagicMock()
-        mock_client.post.return_value = mock_response
+        transport.respond(payload=sample_notion_page)
 
         task = Task(
             id=TaskId.generate(),
@@ -306,16 +375,34 @@ class TestNotionTaskRepository:
         assert created.external_id == "page-123"
 
     @pytest.mark.asyncio
-    async def test_update_task(self, repository, mock_client, sample_notion_page):
+    async def test_create_many(self, repository, transport, sample_notion_page):
+        """Should create one Notion page per task."""
+        transport.respond(payload=sample_notion_page)
+
+        tasks = [
+            Task(
+                id=TaskId.generate(),
+                title=f"New Task {i}",
+                status=TaskStatus.TODO,
+                source=TaskSource.NOTION_TEAM,
+                created_at=datetime.now(),
+                updated_at=datetime.now(),
+            )
+            for i in range(2)
+        ]
+
+        created = await repository.create_many(tasks)
+
+        assert len(created) == 2
+        assert transport.calls == [("POST", "/v1/pages")] * 2
+
+    @pytest.mark.asyncio
+    async def test_update_task(self, repository, transport, sample_notion_page):
         """Should update task in Notion."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_notion_page
-        mock_response.raise_for_status = MagicMock()
-        mock_client.patch.return_value = mock_response
+        transport.respond(payload=sample_notion_page)
 
         task = Task(
-            id=TaskId.from_notion("page-123"),
+            id=_PAGE_ID,
             title="Updated Task",
             status=TaskStatus.IN_PROGRESS,
             source=TaskSource.NOTION_TEAM,
@@ -327,17 +414,15 @@ class TestNotionTaskRepository:
         updated = await repository.update(task)
 
         assert updated is not None
-        mock_client.patch.assert_called_once()
+        assert transport.calls == [("PATCH", "/v1/pages/page-123")]
 
     @pytest.mark.asyncio
-    async def test_update_task_not_found(self, repository, mock_client):
+    async def test_update_task_not_found(self, repository, transport):
         """Should raise error when task not found."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_client.patch.return_value = mock_response
+        transport.respond(404)
 
         task = Task(
-            id=TaskId.from_notion("nonexistent"),
+            id=_MISSING_ID,
             title="Task",
             status=TaskStatus.TODO,
             source=TaskSource.NOTION_TEAM,
@@ -349,90 +434,88 @@ class TestNotionTaskRepository:
             await repository.update(task)
 
     @pytest.mark.asyncio
-    async def test_delete_task(self, repository, mock_client):
+    async def test_delete_task(self, repository, transport):
         """Should archive task in Notion."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status = MagicMock()
-        mock_client.patch.return_value = mock_response
+        transport.respond()
 
-        result = await repository.delete(TaskId.from_notion("page-123"))
+        result = await repository.delete(_PAGE_ID)
 
         assert result is True
-        call_args = mock_client.patch.call_args
-        body = call_args.kwargs["json"]
-        assert body["archived"] is True
+        assert transport.calls == [("PATCH", "/v1/pages/page-123")]
+        assert transport.sent_json()["archived"] is True
 
     @pytest.mark.asyncio
-    async def test_delete_task_not_found(self, repository, mock_client):
+    async def test_delete_task_not_found(self, repository, transport):
         """Should return False when task not found."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_client.patch.return_value = mock_response
+        transport.respond(404)
 
-        result = await repository.delete(TaskId.from_notion("nonexistent"))
+        result = await repository.delete(_MISSING_ID)
 
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_exists_true(self, repository, mock_client, sample_notion_page):
+    async def test_exists_true(self, repository, transport, sample_notion_page):
         """Should return True when task exists."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = sample_notion_page
-        mock_response.raise_for_status = MagicMock()
-        mock_client.get.return_value = mock_response
+        transport.respond(payload=sample_notion_page)
 
-        result = await repository.exists(TaskId.from_notion("page-123"))
+        result = await repository.exists(_PAGE_ID)
 
         assert result is True
 
     @pytest.mark.asyncio
-    async def test_exists_false(self, repository, mock_client):
+    async def test_exists_false(self, repository, transport):
         """Should return False when task doesn't exist."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_client.get.return_value = mock_response
+        transport.respond(404)
 
-        result = await repository.exists(TaskId.from_notion("nonexistent"))
+        result = await repository.exists(_MISSING_ID)
 
         assert result is False
+        assert transport.calls == [("GET", "/v1/pages/nonexistent")]
 
-    def test_build_query_filter_status(self, repository):
-        """Should build status filter."""
-        filter = TaskFilter(status=[TaskStatus.TODO, TaskStatus.IN_PROGRESS])
-
-        query = repository._build_query_filter(filter)
-
-        assert "or" in query
-        assert len(query["or"]) == 2
-
-    def test_build_query_filter_single_status(self, repository):
-        """Should build single status filter without or."""
-        filter = TaskFilter(status=[TaskStatus.TODO])
-
-        query = repository._build_query_filter(filter)
-
-        assert "property" in query
-        assert query["property"] == "Status"
-
-    def test_build_query_filter_combined(self, repository):
-        """Should combine multiple filters with and."""
-        filter = TaskFilter(
-            status=[TaskStatus.TODO],
-            priority=[TaskPriority.HIGH],
-            tags=["bug"],
-        )
-
-        query = repository._build_query_filter(filter)
+    @pytest.mark.asyncio
+    async def test_exists_skips_page_parsing(self, repository, transport):
+        """Should return True from the status code without parsing the page."""
+        # An empty body cannot be decoded, so any parsing attempt would raise
+        transport.respond(200)
 
-        assert "and" in query
-        assert len(query["and"]) == 3
+        result = await repository.exists(_PAGE_ID)
 
-    def test_build_query_filter_empty(self, repository):
-        """Should return empty filter when no criteria."""
-        query = repository._build_query_filter(None)
-        assert query == {}
+        assert result is True
 
-        query = repository._build_query_filter(TaskFilter())
-        assert query == {}
+    @pytest.mark.parametrize(
+        "filter,key,expected",
+        [
+            pytest.param(
+                TaskFilter(status=[TaskStatus.TODO, TaskStatus.IN_PROGRESS]),
+                "or", 2, id="status",
+            ),
+            pytest.param(
+                TaskFilter(status=[TaskStatus.TODO]),
+                "property", "Status", id="single_status",
+            ),
+            pytest.param(
+                TaskFilter(
+                    status=[TaskStatus.TODO],
+                    priority=[TaskPriority.HIGH],
+                    tags=["bug"],
+                ),
+                "and", 3, id="combined",
+            ),
+            pytest.param(None, None, None, id="none"),
+            pytest.param(TaskFilter(), None, None, id="empty"),
+        ],
+    )
+    def test_build_query_filter(self, sync_repository, filter, key, expected):
+        """Should build a Notion filter shaped by the active criteria.
+
+        A single condition is returned as is, several are wrapped in
+        or/and, and no criteria give an empty filter.
+        """
+        query = sync_repository._build_query_filter(filter)
+
+        if key is None:
+            assert query == {}
+        elif key == "property":
+            assert query["property"] == expected
+        else:
+            assert len(query[key]) == expected
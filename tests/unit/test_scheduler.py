@@ -2,7 +2,6 @@
 
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
 
 from src.scheduler.jobs import Job, JobRegistry, create_default_jobs
 from src.scheduler.scheduler import TaskScheduler
@@ -53,10 +52,17 @@ class TestJob:
 class TestJobRegistry:
     """Tests for JobRegistry."""
 
-    @pytest.fixture
-    def registry(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def registry(cls):
         return JobRegistry()
 
+    @pytest.fixture(autouse=True)
+    def _reset(self, registry):
+        """Drop registered jobs so each test starts with an empty registry."""
+        yield
+        registry.clear()
+
     def test_register_job(self, registry):
         """Should register a new job."""
         def my_func():
@@ -222,33 +228,42 @@ class TestCreateDefaultJobs:
     def test_creates_default_jobs(self):
         """Should create default jobs in registry."""
         registry = JobRegistry()
-        mock_container = MagicMock()
-        mock_container.task_service = MagicMock()
-        mock_container.notification_service = MagicMock()
+        # Jobs only read services from the container when they run
+        container = object()
 
-        create_default_jobs(registry, mock_container)
+        create_default_jobs(registry, container)
 
-        jobs = registry.list_jobs()
-        job_names = [j.name for j in jobs]
+        job_names = {j.name for j in registry.list_jobs()}
 
-        assert "sync_team_tasks" in job_names
-        assert "sync_personal_tasks" in job_names
-        assert "send_due_notifications" in job_names
-        assert "send_overdue_notifications" in job_names
-        assert "send_daily_summary" in job_names
+        assert {
+            "sync_team_tasks",
+            "sync_personal_tasks",
+            "send_due_notifications",
+            "send_overdue_notifications",
+            "send_daily_summary",
+        } <= job_names
 
 
 class TestTaskScheduler:
     """Tests for TaskScheduler."""
 
-    @pytest.fixture
-    def registry(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def registry(cls):
         return JobRegistry()
 
-    @pytest.fixture
-    def scheduler(self, registry):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def scheduler(cls, registry):
         return TaskScheduler(registry)
 
+    @pytest.fixture(autouse=True)
+    def _reset(self, scheduler, registry):
+        """Stop the scheduler and drop jobs so tests start from scratch."""
+        yield
+        scheduler.stop()
+        registry.clear()
+
     def test_initial_state(self, scheduler):
         """Should start in stopped state."""
         assert scheduler.is_running is False
@@ -1,8 +1,10 @@
 """Tests for TaskService."""
 
 import pytest
+import pytest_asyncio
 from datetime import datetime, timedelta
 from dataclasses import replace
+from itertools import cycle
 
 from src.services.task_service import TaskService
 from src.repositories.memory import InMemoryTaskRepository, InMemoryCacheRepository
@@ -16,35 +18,79 @@ from src.domain.models import (
 )
 
 
+# Pre-generated IDs; tasks only need to be distinct within a test
+_ID_POOL = cycle([TaskId.generate() for _ in range(32)])
+
+# Filters are only read by TaskService.list_tasks, so they can be shared
+_FILTER_TODO = TaskFilter(status=[TaskStatus.TODO])
+_FILTER_HIGH = TaskFilter(priority=[TaskPriority.HIGH])
+
+
+def _make_task(title, now, **kw) -> Task:
+    """Build a manual TODO task with a pooled ID, stamped at now."""
+    kw.setdefault("status", TaskStatus.TODO)
+    kw.setdefault("source", TaskSource.MANUAL)
+    return Task(id=next(_ID_POOL), title=title, created_at=now, updated_at=now, **kw)
+
+
+# Tasks are never mutated: the service and repositories swap in copies made
+# with dataclasses.replace, so one instance can serve every test.
+@pytest.fixture(scope="module")
+def sample_task() -> Task:
+    now = datetime.now()
+    return Task(
+        id=TaskId.generate(),
+        title="Test task",
+        status=TaskStatus.TODO,
+        source=TaskSource.NOTION_TEAM,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture(scope="module")
+def personal_task() -> Task:
+    now = datetime.now()
+    return Task(
+        id=TaskId.generate(),
+        title="Personal task",
+        status=TaskStatus.TODO,
+        source=TaskSource.NOTION_PERSONAL,
+        created_at=now,
+        updated_at=now,
+    )
+
+
 class TestTaskService:
     """Tests for TaskService."""
 
-    @pytest.fixture
-    def team_repo(self) -> InMemoryTaskRepository:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def team_repo(cls) -> InMemoryTaskRepository:
         return InMemoryTaskRepository()
 
-    @pytest.fixture
-    def personal_repo(self) -> InMemoryTaskRepository:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def personal_repo(cls) -> InMemoryTaskRepository:
         return InMemoryTaskRepository()
 
-    @pytest.fixture
-    def cache(self) -> InMemoryCacheRepository:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def cache(cls) -> InMemoryCacheRepository:
         return InMemoryCacheRepository()
 
-    @pytest.fixture
-    def service(self, team_repo, personal_repo, cache) -> TaskService:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def service(cls, team_repo, personal_repo, cache) -> TaskService:
         return TaskService(team_repo, personal_repo, cache)
 
-    @pytest.fixture
-    def sample_task(self) -> Task:
-        return Task(
-            id=TaskId.generate(),
-            title="Test task",
-            status=TaskStatus.TODO,
-            source=TaskSource.NOTION_TEAM,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
+    @pytest_asyncio.fixture(autouse=True)
+    async def _reset_repos(self, team_repo, personal_repo, cache):
+        """Empty the shared repositories and cache after each test."""
+        yield
+        await team_repo.clear()
+        await personal_repo.clear()
+        await cache.clear()
 
     @pytest.mark.asyncio
     async def test_get_task_from_cache(self, service, cache, sample_task):
@@ -67,24 +113,18 @@ class TestTaskService:
         assert cached == sample_task
 
     @pytest.mark.asyncio
-    async def test_get_task_from_personal_repo(self, service, personal_repo, cache):
+    async def test_get_task_from_personal_repo(
+        self, service, personal_repo, cache, personal_task
+    ):
         """Should get task from personal repo if not in team repo."""
-        task = Task(
-            id=TaskId.generate(),
-            title="Personal task",
-            status=TaskStatus.TODO,
-            source=TaskSource.NOTION_PERSONAL,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        await personal_repo.create(task)
+        await personal_repo.create(personal_task)
 
-        result = await service.get_task(task.id)
+        result = await service.get_task(personal_task.id)
 
-        assert result == task
+        assert result == personal_task
         # Should be cached now
-        cached = await cache.get(task.id.value)
-        assert cached == task
+        cached = await cache.get(personal_task.id.value)
+        assert cached == personal_task
 
     @pytest.mark.asyncio
     async def test_get_task_returns_none_if_not_found(self, service):
@@ -95,78 +135,46 @@ class TestTaskService:
     @pytest.mark.asyncio
     async def test_list_tasks_from_cache(self, service, cache):
         """Should list tasks from cache."""
-        tasks = [
-            Task(
-                id=TaskId.generate(),
-                title=f"Task {i}",
-                status=TaskStatus.TODO,
-                source=TaskSource.MANUAL,
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
-            )
-            for i in range(3)
-        ]
-        for task in tasks:
-            await cache.set(task.id.value, task)
+        now = datetime.now()
+        tasks = [_make_task(f"Task {i}", now) for i in range(3)]
+        await cache.set_many({task.id.value: task for task in tasks})
 
         result = await service.list_tasks()
         assert len(result) == 3
 
     @pytest.mark.asyncio
-    async def test_list_tasks_with_status_filter(self, service, cache):
-        """Should filter tasks by status."""
-        todo_task = Task(
-            id=TaskId.generate(),
-            title="Todo",
-            status=TaskStatus.TODO,
-            source=TaskSource.MANUAL,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        done_task = Task(
-            id=TaskId.generate(),
-            title="Done",
-            status=TaskStatus.DONE,
-            source=TaskSource.MANUAL,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        await cache.set(todo_task.id.value, todo_task)
-        await cache.set(done_task.id.value, done_task)
-
-        result = await service.list_tasks(TaskFilter(status=[TaskStatus.TODO]))
-
-        assert len(result) == 1
-        assert result[0].title == "Todo"
-
-    @pytest.mark.asyncio
-    async def test_list_tasks_with_priority_filter(self, service, cache):
-        """Should filter tasks by priority."""
-        high_task = Task(
-            id=TaskId.generate(),
-            title="High priority",
-            status=TaskStatus.TODO,
-            source=TaskSource.MANUAL,
-            priority=TaskPriority.HIGH,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        low_task = Task(
-            id=TaskId.generate(),
-            title="Low priority",
-            status=TaskStatus.TODO,
-            source=TaskSource.MANUAL,
-            priority=TaskPriority.LOW,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        await cache.set(high_task.id.value, high_task)
-        await cache.set(low_task.id.value, low_task)
-
-        result = await service.list_tasks(TaskFilter(priority=[TaskPriority.HIGH]))
-
-        assert len(result) == 1
-        assert result[0].title == "High priority"
+    @pytest.mark.parametrize(
+        "specs,filter,expected",
+        [
+            pytest.param(
+                {
+                    "Todo": {"status": TaskStatus.TODO},
+                    "Done": {"status": TaskStatus.DONE},
+                },
+                _FILTER_TODO,
+                "Todo",
+                id="status",
+            ),
+            pytest.param(
+                {
+                    "High priority": {"priority": TaskPriority.HIGH},
+                    "Low priority": {"priority": TaskPriority.LOW},
+                },
+                _FILTER_HIGH,
+                "High priority",
+                id="priority",
+            ),
+        ],
+    )
+    async def test_list_tasks_with_filter(self, service, cache, specs, filter, expected):
+        """Should return only the task matching the filter."""
+        now = datetime.now()
+        tasks = [_make_task(title, now, **fields) for title, fields in specs.items()]
+        await cache.set_many({t.id.value: t for t in tasks})
+
+        result = await service.list_tasks(filter)
+
+        assert [t.title for t in result] == [expected]
 
     @pytest.mark.asyncio
     async def test_create_task_in_team_repo(self, service, team_repo, cache, sample_task):
@@ -177,21 +185,14 @@ class TestTaskService:
         assert await cache.get(sample_task.id.value) == created
 
     @pytest.mark.asyncio
-    async def test_create_task_in_personal_repo(self, service, personal_repo, cache):
+    async def test_create_task_in_personal_repo(
+        self, service, personal_repo, cache, personal_task
+    ):
         """Should create task in personal repo when specified."""
-        task = Task(
-            id=TaskId.generate(),
-            title="Personal task",
-            status=TaskStatus.TODO,
-            source=TaskSource.NOTION_PERSONAL,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-
-        created = await service.create_task(task, personal=True)
+        created = await service.create_task(personal_task, personal=True)
 
-        assert await personal_repo.exists(task.id)
-        assert await cache.get(task.id.value) == created
+        assert await personal_repo.exists(personal_task.id)
+        assert await cache.get(personal_task.id.value) == created
 
     @pytest.mark.asyncio
     async def test_update_task_in_team_repo(self, service, team_repo, cache, sample_task):
@@ -207,19 +208,13 @@ class TestTaskService:
         assert cached.title == "Updated title"
 
     @pytest.mark.asyncio
-    async def test_update_task_in_personal_repo(self, service, personal_repo, cache):
+    async def test_update_task_in_personal_repo(
+        self, service, personal_repo, cache, personal_task
+    ):
         """Should update task in personal repo."""
-        task = Task(
-            id=TaskId.generate(),
-            title="Personal task",
-            status=TaskStatus.TODO,
-            source=TaskSource.NOTION_PERSONAL,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        await personal_repo.create(task)
+        await personal_repo.create(personal_task)
 
-        updated_task = replace(task, title="Updated personal")
+        updated_task = replace(personal_task, title="Updated personal")
         result = await service.update_task(updated_task)
 
         assert result.title == "Updated personal"
@@ -259,23 +254,17 @@ class TestTaskService:
         assert await cache.get(sample_task.id.value) is None
 
     @pytest.mark.asyncio
-    async def test_delete_task_from_personal_repo(self, service, personal_repo, cache):
+    async def test_delete_task_from_personal_repo(
+        self, service, personal_repo, cache, personal_task
+    ):
         """Should delete task from personal repo."""
-        task = Task(
-            id=TaskId.generate(),
-            title="Personal task",
-            status=TaskStatus.TODO,
-            source=TaskSource.NOTION_PERSONAL,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        await personal_repo.create(task)
-        await cache.set(task.id.value, task)
+        await personal_repo.create(personal_task)
+        await cache.set(personal_task.id.value, personal_task)
 
-        result = await service.delete_task(task.id)
+        result = await service.delete_task(personal_task.id)
 
         assert result is True
-        assert await personal_repo.exists(task.id) is False
+        assert await personal_repo.exists(personal_task.id) is False
 
     @pytest.mark.asyncio
     async def test_delete_nonexistent_returns_false(self, service):
@@ -286,42 +275,27 @@ class TestTaskService:
     @pytest.mark.asyncio
     async def test_sync_from_team(self, service, team_repo, cache):
         """Should sync tasks from team repo to cache."""
+        now = datetime.now()
         tasks = [
-            Task(
-                id=TaskId.generate(),
-                title=f"Task {i}",
-                status=TaskStatus.TODO,
-                source=TaskSource.NOTION_TEAM,
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
-            )
+            _make_task(f"Task {i}", now, source=TaskSource.NOTION_TEAM)
             for i in range(3)
         ]
-        for task in tasks:
-            await team_repo.create(task)
+        await team_repo.create_many(tasks)
 
         count = await service.sync_from_team()
 
         assert count == 3
-        cached = await cache.get_all()
-        assert len(cached) == 3
+        assert await cache.size() == 3
 
     @pytest.mark.asyncio
     async def test_sync_from_personal(self, service, personal_repo, cache):
         """Should sync tasks from personal repo to cache."""
+        now = datetime.now()
         tasks = [
-            Task(
-                id=TaskId.generate(),
-                title=f"Personal task {i}",
-                status=TaskStatus.TODO,
-                source=TaskSource.NOTION_PERSONAL,
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
-            )
+            _make_task(f"Personal task {i}", now, source=TaskSource.NOTION_PERSONAL)
             for i in range(2)
         ]
-        for task in tasks:
-            await personal_repo.create(task)
+        await personal_repo.create_many(tasks)
 
         count = await service.sync_from_personal()
 
@@ -330,22 +304,9 @@ class TestTaskService:
     @pytest.mark.asyncio
     async def test_sync_all(self, service, team_repo, personal_repo, cache):
         """Should sync tasks from both repositories."""
-        team_task = Task(
-            id=TaskId.generate(),
-            title="Team task",
-            status=TaskStatus.TODO,
-            source=TaskSource.NOTION_TEAM,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        personal_task = Task(
-            id=TaskId.generate(),
-            title="Personal task",
-            status=TaskStatus.TODO,
-            source=TaskSource.NOTION_PERSONAL,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
+        now = datetime.now()
+        team_task = _make_task("Team task", now, source=TaskSource.NOTION_TEAM)
+        personal_task = _make_task("Personal task", now, source=TaskSource.NOTION_PERSONAL)
         await team_repo.create(team_task)
         await personal_repo.create(personal_task)
 
@@ -355,69 +316,26 @@ class TestTaskService:
         assert result["personal_tasks"] == 1
 
     @pytest.mark.asyncio
-    async def test_get_tasks_due_today(self, service, cache):
-        """Should get tasks due today."""
-        due_today = Task(
-            id=TaskId.generate(),
-            title="Due today",
-            status=TaskStatus.TODO,
-            source=TaskSource.MANUAL,
-            due_date=datetime.now(),
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        due_tomorrow = Task(
-            id=TaskId.generate(),
-            title="Due tomorrow",
-            status=TaskStatus.TODO,
-            source=TaskSource.MANUAL,
-            due_date=datetime.now() + timedelta(days=1),
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        await cache.set(due_today.id.value, due_today)
-        await cache.set(due_tomorrow.id.value, due_tomorrow)
-
-        result = await service.get_tasks_due_today()
-
-        assert len(result) == 1
-        assert result[0].title == "Due today"
-
-    @pytest.mark.asyncio
-    async def test_get_overdue_tasks(self, service, cache):
-        """Should get overdue tasks."""
-        overdue = Task(
-            id=TaskId.generate(),
-            title="Overdue",
-            status=TaskStatus.TODO,
-            source=TaskSource.MANUAL,
-            due_date=datetime.now() - timedelta(days=1),
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        not_overdue = Task(
-            id=TaskId.generate(),
-            title="Not overdue",
-            status=TaskStatus.TODO,
-            source=TaskSource.MANUAL,
-            due_date=datetime.now() + timedelta(days=1),
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+    @pytest.mark.parametrize(
+        "query,due_offset_days,status,matches",
+        [
+            pytest.param("get_tasks_due_today", 0, TaskStatus.TODO, True, id="due_today"),
+            pytest.param("get_tasks_due_today", 1, TaskStatus.TODO, False, id="due_tomorrow"),
+            pytest.param("get_overdue_tasks", -1, TaskStatus.TODO, True, id="overdue"),
+            pytest.param("get_overdue_tasks", 1, TaskStatus.TODO, False, id="not_overdue"),
+            pytest.param("get_overdue_tasks", -1, TaskStatus.DONE, False, id="done_overdue"),
+        ],
+    )
+    async def test_due_date_queries(
+        self, service, cache, query, due_offset_days, status, matches
+    ):
+        """Should return a task only when its due date and status match the query."""
+        now = datetime.now()
+        task = _make_task(
+            "Task", now, status=status, due_date=now + timedelta(days=due_offset_days)
         )
-        done_overdue = Task(
-            id=TaskId.generate(),
-            title="Done overdue",
-            status=TaskStatus.DONE,
-            source=TaskSource.MANUAL,
-            due_date=datetime.now() - timedelta(days=1),
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
-        )
-        await cache.set(overdue.id.value, overdue)
-        await cache.set(not_overdue.id.value, not_overdue)
-        await cache.set(done_overdue.id.value, done_overdue)
+        await cache.set(task.id.value, task)
 
-        result = await service.get_overdue_tasks()
+        result = await getattr(service, query)()
 
-        assert len(result) == 1
-        assert result[0].title == "Overdue"
+        assert [t.id for t in result] == ([task.id] if matches else [])